@@ -0,0 +1,89 @@
+# End-to-End-Latenztest: MainWindow.toggle_record -> finish_recording -> Text im Fenster
+# Läuft headless (Qt offscreen) mit einer Datei- bzw. synthetischen Audioquelle statt Mikrofon.
+#
+#   python benchmarks/bench_e2e.py --model base --engine faster-whisper --record-s 20 --runs 3
+#   python benchmarks/bench_e2e.py --audio memo.wav --streaming -o e2e.json
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Nebenwirkung: bench_transcribe trägt beim Import das Repo-Verzeichnis in sys.path ein (logic/, ui/ unten)
+from bench_transcribe import synthetic_speech, _make_transcriber, _git_commit
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SnapScribe End-to-End-Latenz (headless)")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--engine", default="whisper")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--audio", help="Audiodatei als Mikrofon-Ersatz (sonst synthetisch)")
+    parser.add_argument("--record-s", type=float, default=15, help="Aufnahmedauer pro Lauf")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = Echtzeit, 0 = so schnell wie möglich")
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("-o", "--output")
+    args = parser.parse_args(argv)
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+    from logic.audio_source import ArraySource, FileSource
+    from ui.main_window import MainWindow
+
+    class _HotkeyStub(QObject):
+        """Ersetzt GlobalHotkeyManager (Windows-only) für den Test"""
+        registration_failed = pyqtSignal(str, str)
+        def update_hotkeys(self): pass
+
+    app = QApplication(sys.argv)
+    if args.audio:
+        source = FileSource(args.audio, speed=args.speed)
+    else:
+        source = ArraySource(synthetic_speech(args.record_s + 1), speed=args.speed)
+    transcriber = _make_transcriber(args.engine, args.model, args.compute_type, 0)
+    transcriber.audio_source = source
+    transcriber.config.update(streaming=args.streaming, auto_copy=False)
+    transcriber.load_model()
+
+    window = MainWindow(transcriber.config, transcriber, _HotkeyStub())
+    latencies, marks = [], {}
+
+    def start_run():
+        marks.clear()
+        window.toggle_record()
+        # Bei speed > 1 entspricht record-s Audio-Sekunden entsprechend weniger Wandzeit
+        wall = args.record_s / args.speed if args.speed > 0 else 0.5
+        QTimer.singleShot(int(wall * 1000), stop_run)
+
+    def stop_run():
+        marks["stop"] = time.perf_counter()
+        window.finish_recording()
+
+    def on_finished(text):
+        latencies.append(time.perf_counter() - marks["stop"])
+        print(f"[E2E] Lauf {len(latencies)}: {latencies[-1]:.3f}s Stop bis Text ({len(text)} Zeichen)", flush=True)
+        if len(latencies) < args.runs:
+            QTimer.singleShot(200, start_run)
+        else:
+            app.quit()
+
+    # Nach MainWindow verbunden -> misst bis nach dem Update des Textfelds
+    transcriber.signals.finished.connect(on_finished)
+    QTimer.singleShot(0, start_run)
+    app.exec()
+
+    result = {"commit": _git_commit(), "engine": args.engine, "model": args.model, "streaming": args.streaming,
+              "record_s": args.record_s, "speed": args.speed, "stop_to_text_s": [round(l, 3) for l in latencies],
+              "median_s": round(statistics.median(latencies), 3)}
+    print(json.dumps(result))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
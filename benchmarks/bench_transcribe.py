@@ -0,0 +1,182 @@
+# Benchmark: Real-Time-Factor, Stop-bis-Text-Latenz, Peak-RSS und Ladezeit pro Modell/Engine
+# Läuft ohne Mikrofon und GUI. Jede Kombination läuft in einem eigenen Prozess, damit Peak-RSS
+# und Ladezeit nicht von vorherigen Modellen verfälscht werden.
+#
+#   python benchmarks/bench_transcribe.py --models base small --engines whisper faster-whisper -o bench.json
+#   python benchmarks/bench_transcribe.py --compare alt.json neu.json
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SAMPLE_RATE = 16000
+MODELS = ["base", "small", "medium", "large-v3"]
+ENGINES = ["whisper", "faster-whisper"]
+# Bei diesen Kennzahlen ist kleiner besser
+METRICS = ["load_s", "rtf", "stop_to_text_s", "peak_rss_mb"]
+
+def synthetic_speech(seconds, seed=0):
+    """Deterministisches 'Sprach'-Signal: Vokal-artige Tonfolgen mit Pausen, dazu leises Rauschen"""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    audio = (rng.standard_normal(n) * 0.003).astype(np.float32)
+    pos = 0
+    while pos < n:
+        length = int(rng.uniform(0.15, 0.6) * SAMPLE_RATE)
+        t = np.arange(min(length, n - pos)) / SAMPLE_RATE
+        f0 = rng.uniform(100, 220)
+        # Grundton + zwei Formanten, mit Hüllkurve
+        tone = sum(a * np.sin(2 * np.pi * f * t) for a, f in ((0.3, f0), (0.15, f0 * 3.1), (0.08, f0 * 7.3)))
+        audio[pos:pos + len(t)] += (tone * np.hanning(len(t))).astype(np.float32)
+        pos += length + int(rng.choice([0.05, 0.1, 0.3, 1.5], p=[0.4, 0.3, 0.2, 0.1]) * SAMPLE_RATE)
+    return audio
+
+def peak_rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+    except ImportError:
+        return None
+
+class _Config(dict):
+    """ConfigManager-Ersatz ohne settings.json (Benchmark soll reproduzierbar sein)"""
+    load_error = None
+    def get(self, key): return dict.get(self, key)
+    def set(self, key, val): self[key] = val
+    def add_listener(self, callback): pass
+    def flush(self): pass
+
+def _make_transcriber(engine, model, compute_type, threads):
+    from logic.backend import ConfigManager, AudioTranscriber
+    config = _Config(ConfigManager().default)
+    config.update(active_mode="local", engine=engine, local_model_size=model, compute_type=compute_type,
+                  cpu_threads=threads, result_cache=False, streaming=False, worker_process=False,
+                  idle_unload_min=0, long_audio_workers=0)
+    return AudioTranscriber(config)
+
+def _stop_to_text(transcriber, audio):
+    """Simulierte Aufnahme: Puffer füllen, Job in die Queue, Zeit bis zum finished-Signal"""
+    import numpy as np
+    from PyQt6.QtCore import Qt
+    from logic.audio_buffer import CaptureBuffer
+    from logic.jobs import TranscriptionJob
+
+    data = CaptureBuffer(SAMPLE_RATE)
+    data.write(np.clip(audio * 32768, -32768, 32767).astype(np.int16))
+    job = TranscriptionJob(data)
+    done = threading.Event()
+    # DirectConnection: ohne Qt-Eventloop direkt im Queue-Thread aufrufen
+    transcriber.signals.finished.connect(lambda text: done.set(), Qt.ConnectionType.DirectConnection)
+    job.recording = False
+    start = time.perf_counter()
+    transcriber.jobs.submit(job)
+    done.wait()
+    return time.perf_counter() - start
+
+def run_single(engine, model, compute_type, threads, audio_path, seconds):
+    """Eine Kombination messen (läuft im Kindprozess)"""
+    if audio_path:
+        from logic.batch import read_audio
+        audio = read_audio(audio_path).read()
+    else:
+        audio = synthetic_speech(seconds)
+    duration = len(audio) / SAMPLE_RATE
+
+    transcriber = _make_transcriber(engine, model, compute_type, threads)
+    start = time.perf_counter()
+    transcriber.load_model()
+    load_s = time.perf_counter() - start
+
+    transcriber.transcribe_audio(audio[:SAMPLE_RATE])  # Warmup (erste Inferenz allokiert Puffer)
+    start = time.perf_counter()
+    transcriber.transcribe_audio(audio)
+    infer_s = time.perf_counter() - start
+
+    return {"engine": engine, "model": model, "compute_type": transcriber.model.compute_type,
+            "threads": threads, "audio": audio_path or f"synthetic:{seconds}s", "audio_s": round(duration, 2),
+            "load_s": round(load_s, 3), "infer_s": round(infer_s, 3), "rtf": round(infer_s / duration, 4),
+            "stop_to_text_s": round(_stop_to_text(transcriber, audio), 3), "peak_rss_mb": peak_rss_mb()}
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(old_path, new_path, tolerance=0.10):
+    """Vergleicht zwei Ergebnisdateien, markiert Verschlechterungen über 'tolerance'"""
+    with open(old_path) as f: old = json.load(f)
+    with open(new_path) as f: new = json.load(f)
+    key = lambda r: (r["engine"], r["model"], r["compute_type"], r["audio"])
+    before = {key(r): r for r in old["results"] if "error" not in r}
+    regressions = 0
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+    for r in new["results"]:
+        b = before.get(key(r))
+        if b is None or "error" in r: continue
+        for m in METRICS:
+            if not b.get(m) or r.get(m) is None: continue
+            change = r[m] / b[m] - 1
+            flag = "  REGRESSION" if change > tolerance else ""
+            regressions += bool(flag)
+            print(f"  {r['engine']:15} {r['model']:9} {m:15} {b[m]:>9} -> {r[m]:>9} ({change:+.1%}){flag}")
+    return 1 if regressions else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SnapScribe Transkriptions-Benchmark")
+    parser.add_argument("--models", nargs="+", default=MODELS)
+    parser.add_argument("--engines", nargs="+", default=ENGINES)
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--audio", nargs="*", default=[], help="Aufgenommene Dateien zusätzlich zum synthetischen Audio")
+    parser.add_argument("--seconds", type=float, default=60, help="Länge des synthetischen Audios")
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("ALT", "NEU"))
+    parser.add_argument("--single", nargs=3, metavar=("ENGINE", "MODEL", "AUDIO"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare)
+
+    if args.single:
+        engine, model, audio = args.single
+        result = run_single(engine, model, args.compute_type, args.threads, audio or None, args.seconds)
+        print(json.dumps(result))
+        return 0
+
+    results = []
+    for audio in [""] + args.audio:
+        for engine in args.engines:
+            for model in args.models:
+                print(f"[Bench] {engine} {model} {audio or 'synthetisch'} ...", flush=True)
+                cmd = [sys.executable, os.path.abspath(__file__), "--single", engine, model, audio,
+                       "--compute-type", args.compute_type, "--threads", str(args.threads), "--seconds", str(args.seconds)]
+                proc = subprocess.run(cmd, capture_output=True, text=True)
+                lines = proc.stdout.strip().splitlines()
+                if proc.returncode == 0 and lines:
+                    results.append(json.loads(lines[-1]))
+                else:
+                    err = (proc.stderr.strip().splitlines() or ["unbekannter Fehler"])[-1]
+                    results.append({"engine": engine, "model": model, "audio": audio or "synthetic", "error": err})
+                print(f"        {results[-1]}")
+
+    report = {"commit": _git_commit(), "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                          "cpus": os.cpu_count()},
+              "results": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[Bench] Ergebnisse in {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
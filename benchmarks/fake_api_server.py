@@ -0,0 +1,102 @@
+# Lokaler Ersatz für die Transkriptions-API (POST /audio/transcriptions, OpenAI-kompatibel)
+# Antwortet mit Dauer und Größe des hochgeladenen Stücks statt echtem Text. Latenz und Fehler (503/429)
+# lassen sich einstellen, um Parallel-Upload, Ratenlimit und Retry/Backoff ohne Netz zu prüfen.
+#
+#   python benchmarks/fake_api_server.py --port 8765 --latency 0.5 --fail-every 3
+#   settings.json: "active_mode": "api", "api_base_url": "http://127.0.0.1:8765/v1"
+
+import argparse
+import io
+import json
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import soundfile as sf
+
+class _State:
+    def __init__(self, latency, fail_every):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+def _parse_multipart(content_type, body):
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    fields, files = {}, {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if part.get_filename(): files[name] = part.get_payload(decode=True)
+        else: fields[name] = part.get_content().strip()
+    return fields, files
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-Alive, damit der Connection-Pool des Clients greift
+
+        def _reply(self, status, payload, headers=()):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in headers: self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if not self.path.endswith("/audio/transcriptions"):
+                return self._reply(404, {"error": "not found"})
+            with state.lock:
+                state.requests += 1
+                n = state.requests
+                state.active += 1
+                state.max_active = max(state.max_active, state.active)
+            try:
+                time.sleep(state.latency)
+                if state.fail_every and n % state.fail_every == 0:
+                    return self._reply(503, {"error": "simulated outage"}, [("Retry-After", "1")])
+                fields, files = _parse_multipart(self.headers["Content-Type"], body)
+                info = sf.info(io.BytesIO(files["file"]))
+                text = f"[{fields.get('model')} {info.duration:.1f}s {len(files['file']) // 1024}KB]"
+                self._reply(200, {"text": text})
+            finally:
+                with state.lock:
+                    state.active -= 1
+
+        def log_message(self, fmt, *args):
+            print(f"[API-Stub] {self.address_string()} {fmt % args} (parallel max {state.max_active})")
+
+    return Handler
+
+def serve(port=8765, latency=0.0, fail_every=0):
+    """Startet den Server in einem Hintergrund-Thread; liefert (server, state)"""
+    state = _State(latency, fail_every)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lokaler Ersatz-Server für die SnapScribe-API-Anbindung")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="Sekunden pro Anfrage")
+    parser.add_argument("--fail-every", type=int, default=0, help="Jede n-te Anfrage mit 503 beantworten")
+    args = parser.parse_args(argv)
+    server, _state = serve(args.port, args.latency, args.fail_every)
+    print(f"[API-Stub] http://127.0.0.1:{args.port}/v1 - Strg+C beendet")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
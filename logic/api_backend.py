@@ -0,0 +1,116 @@
+# Transkription über eine HTTP-API (OpenAI-kompatibel: POST {base_url}/audio/transcriptions)
+# Eine Session mit Connection-Pool bleibt offen, Audio geht als FLAC statt Rohdaten raus, lange Aufnahmen
+# werden an leisen Stellen geteilt und gleichzeitig hochgeladen - begrenzt durch ein Ratenlimit.
+# Über api_base_url lässt sich ein lokaler Ersatz-Server verwenden (benchmarks/fake_api_server.py).
+
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import soundfile as sf
+from requests.adapters import HTTPAdapter
+
+from logic.long_audio import split_points, merge_texts
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+RETRY_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+class ApiError(Exception):
+    pass
+
+class RateLimiter:
+    """Höchstens 'per_minute' Anfragen pro Minute, gleichmäßig verteilt (0 = unbegrenzt)"""
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval: return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now: time.sleep(slot - now)
+
+def encode_flac(audio, samplerate=16000):
+    """float32 [-1, 1] -> FLAC (16 bit), etwa ein Sechstel der Rohdaten"""
+    out = io.BytesIO()
+    sf.write(out, audio, samplerate, subtype="PCM_16", format="FLAC")
+    return out.getvalue()
+
+class ApiTranscriber:
+    def __init__(self, config):
+        self.base_url = (config.get("api_base_url") or DEFAULT_BASE_URL).rstrip("/")
+        self.api_key = config.get("api_key") or ""
+        self.model = config.get("api_model") or "whisper-1"
+        self.workers = max(1, int(config.get("api_concurrency") or 1))
+        self.chunk_s = float(config.get("api_chunk_s") or 600)
+        self.retries = int(config.get("api_retries") or 0)
+        self.timeout = float(config.get("api_timeout_s") or 120)
+        self.limiter = RateLimiter(float(config.get("api_rate_per_min") or 0))
+        self.stats = {"requests": 0, "retries": 0, "bytes_sent": 0}
+
+        # Ein Pool-Slot pro gleichzeitigem Upload; Wiederholungen regeln wir selbst (mit Backoff)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if self.api_key: self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="api-upload")
+
+    def warm(self):
+        """Verbindung (TCP + TLS) vorab aufbauen, damit der erste Upload nicht darauf wartet"""
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.RequestException:
+            pass
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+        self.session.close()
+
+    def _post(self, data, language, prompt):
+        fields = {"model": self.model, "response_format": "json"}
+        if language: fields["language"] = language
+        if prompt: fields["prompt"] = prompt
+        for attempt in range(self.retries + 1):
+            self.limiter.wait()
+            self.stats["requests"] += 1
+            self.stats["bytes_sent"] += len(data)
+            retry_after = None
+            try:
+                r = self.session.post(f"{self.base_url}/audio/transcriptions", data=fields,
+                                      files={"file": ("audio.flac", data, "audio/flac")}, timeout=self.timeout)
+                if r.status_code not in RETRY_STATUS:
+                    if not r.ok: raise ApiError(f"HTTP {r.status_code}: {r.text[:200]}")
+                    return r.json().get("text", "").strip()
+                error = ApiError(f"HTTP {r.status_code}")
+                retry_after = r.headers.get("Retry-After")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if attempt == self.retries: raise error
+            self.stats["retries"] += 1
+            # Exponentiell mit Jitter; ein Retry-After des Servers hat Vorrang
+            delay = 0.5 * 2 ** attempt * (0.5 + random.random())
+            if retry_after and retry_after.isdigit(): delay = max(delay, float(retry_after))
+            print(f"[API] {error} - neuer Versuch in {delay:.1f}s")
+            time.sleep(delay)
+
+    def transcribe(self, audio, samplerate=16000, language=None, cancelled=lambda: False):
+        """Kurze Aufnahmen in einem Upload, lange in Stücken parallel; Reihenfolge bleibt erhalten"""
+        if len(audio) <= self.chunk_s * samplerate:
+            bounds = [0, len(audio)]
+        else:
+            bounds = split_points(audio, samplerate, self.chunk_s)
+
+        def upload(span):
+            if cancelled(): return ""
+            return self._post(encode_flac(audio[span[0]:span[1]], samplerate), language, None)
+
+        spans = list(zip(bounds[:-1], bounds[1:]))
+        if len(spans) == 1: return upload(spans[0])
+        return merge_texts(list(self._pool.map(upload, spans)))
@@ -0,0 +1,83 @@
+# Dauerbereitschaft für die Aufnahme in SnapScribe
+# Der Eingang bleibt offen und hält die letzten preroll_s Sekunden in einem Ring. Eine Aufnahme hängt sich
+# nur noch an den laufenden Stream an und bekommt den Ring als ersten Block - kein Öffnen des Geräts,
+# und der Wortanfang vor bzw. während des Hotkeys ist mit drin.
+
+import threading
+
+import numpy as np
+
+class ArmedStream:
+    """Ein dauerhaft offener Stream einer Audioquelle; session(callback) ersetzt source.stream(...)"""
+    def __init__(self, source, samplerate, preroll_s=0.5):
+        self.source = source
+        self.samplerate = samplerate
+        self.preroll_s = preroll_s
+        self._ring = np.zeros(max(1, int(samplerate * preroll_s)), dtype=np.int16)
+        self._pos = 0
+        self._filled = 0
+        self._target = None
+        self._lock = threading.Lock()
+        self._stream = None
+
+    def open(self):
+        self._stream = self.source.stream(self.samplerate, self._callback)
+        self._stream.__enter__()
+
+    def close(self):
+        if self._stream is None: return
+        self._stream.__exit__(None, None, None)
+        self._stream = None
+
+    def _callback(self, indata, frames, time, status):
+        with self._lock:
+            if self._target is not None:
+                self._target(indata, frames, time, status)
+            else:
+                self._remember(indata.reshape(-1))
+
+    def _remember(self, samples):
+        size = len(self._ring)
+        samples = samples[-size:]
+        n = len(samples)
+        first = min(n, size - self._pos)
+        self._ring[self._pos:self._pos + first] = samples[:first]
+        self._ring[:n - first] = samples[first:]
+        self._pos = (self._pos + n) % size
+        self._filled = min(size, self._filled + n)
+
+    def _preroll(self):
+        """Ring-Inhalt in zeitlicher Reihenfolge als (frames x 1)-Block"""
+        if self._filled < len(self._ring):
+            block = self._ring[self._pos - self._filled:self._pos].copy()
+        else:
+            block = np.concatenate([self._ring[self._pos:], self._ring[:self._pos]])
+        self._pos = self._filled = 0
+        return block.reshape(-1, 1)
+
+    def attach(self, callback):
+        with self._lock:
+            block = self._preroll()
+            if len(block): callback(block, len(block), None, None)
+            self._target = callback
+
+    def detach(self, callback):
+        with self._lock:
+            # Eine direkt folgende Aufnahme kann sich schon angehängt haben
+            if self._target is callback: self._target = None
+
+    def session(self, callback):
+        return _Session(self, callback)
+
+class _Session:
+    """Context-Manager wie sd.InputStream, hängt sich nur an den offenen Stream an"""
+    def __init__(self, armed, callback):
+        self._armed = armed
+        self._callback = callback
+
+    def __enter__(self):
+        self._armed.attach(self._callback)
+        return self
+
+    def __exit__(self, *exc):
+        self._armed.detach(self._callback)
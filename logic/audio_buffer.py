@@ -0,0 +1,64 @@
+# Aufnahme-Puffer für SnapScribe
+# Speichert int16-Samples in festen, vorab allozierten Chunks statt einer Liste von Kopien
+
+import numpy as np
+
+_SCALE = np.float32(1.0 / 32768)
+
+class CaptureBuffer:
+    """Wachsender int16-Puffer: der Audio-Callback schreibt nur in vorhandenen Speicher"""
+    path = None         # Nur SpillingBuffer schreibt in eine Datei
+    def __init__(self, samplerate=16000, chunk_seconds=30):
+        self.samplerate = samplerate
+        self.chunk_size = int(samplerate * chunk_seconds)
+        self._chunks = [np.empty(self.chunk_size, dtype=np.int16)]
+        self._fill = 0      # Füllstand des letzten Chunks
+        self._length = 0    # Gesamtzahl Samples
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def seconds(self):
+        return self._length / self.samplerate
+
+    @property
+    def nbytes(self):
+        return len(self._chunks) * self.chunk_size * 2
+
+    def clear(self):
+        self._chunks = self._chunks[:1]
+        self._fill = 0
+        self._length = 0
+
+    def close(self):
+        """Nichts zu tun - Gegenstück zu SpillingBuffer.close"""
+
+    def write(self, block):
+        """Kopiert einen Block (frames x 1, int16) direkt in den Chunk-Speicher"""
+        src = block.reshape(-1)
+        pos, frames = 0, len(src)
+        while pos < frames:
+            if self._fill == self.chunk_size:
+                # Einzige Allokation: alle chunk_seconds ein neuer Chunk
+                self._chunks.append(np.empty(self.chunk_size, dtype=np.int16))
+                self._fill = 0
+            n = min(frames - pos, self.chunk_size - self._fill)
+            self._chunks[-1][self._fill:self._fill + n] = src[pos:pos + n]
+            self._fill += n
+            pos += n
+        # Länge erst nach dem Schreiben erhöhen, damit Leser nie halbfertige Daten sehen
+        self._length += frames
+
+    def read(self, start=0, end=None):
+        """Liefert [start, end) als float32 in [-1, 1] - genau eine Konvertierung, kein concatenate"""
+        end = self._length if end is None else min(end, self._length)
+        out = np.empty(max(0, end - start), dtype=np.float32)
+        o = 0
+        while start < end:
+            idx, offset = divmod(start, self.chunk_size)
+            n = min(end - start, self.chunk_size - offset)
+            np.multiply(self._chunks[idx][offset:offset + n], _SCALE, out=out[o:o + n])
+            start += n
+            o += n
+        return out
@@ -0,0 +1,81 @@
+# Audioquellen für SnapScribe
+# AudioTranscriber nimmt über eine Quelle auf statt direkt über sounddevice. Neben dem echten
+# Mikrofon gibt es Datei- und Generator-Quellen, damit die Pipeline headless und deterministisch läuft.
+
+import threading
+import time
+
+import numpy as np
+
+class SoundDeviceSource:
+    """Echtes Mikrofon über sounddevice"""
+    def __init__(self, sd=None):
+        if sd is None: import sounddevice as sd
+        self.sd = sd
+
+    def stream(self, samplerate, callback):
+        return self.sd.InputStream(samplerate=samplerate, channels=1, dtype="int16", callback=callback)
+
+class _BlockPump:
+    """Context-Manager wie sd.InputStream: ein Thread ruft den Callback mit den Blöcken der Quelle auf"""
+    def __init__(self, blocks, callback, samplerate, speed, blocksize):
+        self._blocks = blocks
+        self._callback = callback
+        self._samplerate = samplerate
+        self._speed = speed
+        self._blocksize = blocksize
+        self._running = False
+        self._thread = None
+
+    def __enter__(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._running = False
+        self._thread.join()
+
+    def _run(self):
+        start = time.perf_counter()
+        delivered = 0
+        silence = np.zeros((self._blocksize, 1), dtype=np.int16)
+        blocks = iter(self._blocks)
+        speed = self._speed
+        while self._running:
+            block = next(blocks, None)
+            if block is None:
+                # Quelle erschöpft: Stille wie ein Mikrofon in einem leisen Raum, aber nur in Echtzeit -
+                # sonst liefert speed=0 bis zum Stopp minutenlang Stille
+                if speed != 1.0:
+                    start, delivered, speed = time.perf_counter(), 0, 1.0
+                block = silence
+            self._callback(block, len(block), None, None)
+            delivered += len(block)
+            if speed > 0:
+                # Echtzeit (speed=1) oder schneller; auf die Gesamtzeit takten, damit sich nichts aufsummiert
+                delay = start + delivered / (self._samplerate * speed) - time.perf_counter()
+                if delay > 0: time.sleep(delay)
+
+class GeneratorSource:
+    """Liefert int16-Blöcke (frames x 1) aus einer Fabrik-Funktion, die pro Aufnahme neu aufgerufen wird"""
+    def __init__(self, factory, blocksize=1600, speed=1.0):
+        self.factory = factory
+        self.blocksize = blocksize
+        self.speed = speed  # 1.0 = Echtzeit, 0 = so schnell wie möglich
+
+    def stream(self, samplerate, callback):
+        return _BlockPump(self.factory(), callback, samplerate, self.speed, self.blocksize)
+
+class ArraySource(GeneratorSource):
+    """Spielt ein float32-Array (16 kHz mono, [-1, 1]) als Mikrofon-Eingang ab"""
+    def __init__(self, audio, blocksize=1600, speed=1.0):
+        pcm = np.clip(np.asarray(audio) * 32768, -32768, 32767).astype(np.int16).reshape(-1, 1)
+        super().__init__(lambda: (pcm[i:i + blocksize] for i in range(0, len(pcm), blocksize)), blocksize, speed)
+
+class FileSource(ArraySource):
+    """Spielt eine Audiodatei ab (beliebige Samplerate, wird auf 16 kHz mono gebracht)"""
+    def __init__(self, path, blocksize=1600, speed=1.0):
+        from logic.batch import read_audio
+        super().__init__(read_audio(path).read(), blocksize, speed)
@@ -2,151 +2,662 @@ import json
 import os
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QObject, pyqtSignal
+from logic.engines import create_engine
+from logic.model_cache import ModelRegistry
+from logic.jobs import TranscriptionJob, JobQueue
+from logic.tracing import Tracer, span
 
 SETTINGS_FILE = "settings.json"
+SAMPLE_RATE = 16000
+# Einstellungen, deren Änderung ein anderes Modell (oder den API-Modus) bedeutet
+MODEL_KEYS = frozenset({"active_mode", "local_model_size", "engine", "compute_type", "cpu_threads", "worker_process",
+                        "draft_model"})
 
 class WorkerSignals(QObject):
     finished = pyqtSignal(str)
     status = pyqtSignal(str)
     progress = pyqtSignal(str, int)
     error = pyqtSignal(str)
-    amplitude = pyqtSignal(float)  # <--- NEU: Sendet Lautstärkepegel an GUI
+    partial = pyqtSignal(str)      # Zwischenergebnis im Streaming-Modus
+    draft = pyqtSignal(str)        # Schneller Entwurf (kleines Modell), finished bringt danach den verfeinerten Text
+    auto_stopped = pyqtSignal()    # Aufnahme wurde per Endpointing beendet
+    trace = pyqtSignal(object)     # Fertiger Zeitmessungs-Datensatz pro Job (dict)
 
 class ConfigManager:
-    def __init__(self):
+    """Einstellungen aus settings.json
+
+    update() setzt mehrere Schlüssel mit genau einem Schreibvorgang (temporäre Datei + os.replace,
+    ein Absturz hinterlässt nie eine halbe Datei). Mit flush_delay > 0 wird gebündelt im Hintergrund
+    geschrieben. Listener bekommen die Menge der tatsächlich geänderten Schlüssel.
+    """
+    def __init__(self, path=SETTINGS_FILE, flush_delay=0.0):
+        self.path = path
+        self.flush_delay = flush_delay
+        self.load_error = None       # Meldung, falls settings.json beschädigt war
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._timer = None
         self.default = {
             "api_key": "", "active_mode": "local", "auto_copy": True,
             "minimize_to_tray": True, "hotkey_record": "windows+shift+q",
             "hotkey_show": "windows+shift+d", "local_model_size": "base",
-            "language": "en"
+            "language": "en", "streaming": False, "stream_window_s": 20,
+            "engine": "whisper", "compute_type": "int8", "cpu_threads": 0,
+            "vad_trim": True, "auto_stop": False, "auto_stop_silence_s": 1.5,
+            "auto_stop_threshold": 0.01, "auto_stop_min_speech_s": 0.3,
+            "model_cache_mb": 4000, "idle_unload_min": 0, "idle_fallback_model": "",
+            "worker_process": False, "long_audio_workers": 0, "long_audio_min_s": 180,
+            "long_audio_segment_s": 120, "result_cache": True, "result_cache_dir": "cache",
+            "result_cache_mb": 50, "trace_enabled": False, "trace_file": "traces.jsonl",
+            "visualizer_bars": 50, "tray_start": False, "startup_report": False, "startup_budget_ms": 500,
+            "always_armed": False, "preroll_ms": 500,
+            "spill_to_disk": False, "spill_dir": "recordings", "spill_format": "wav", "spill_window_s": 60,
+            "spill_keep": False, "api_base_url": "", "api_model": "whisper-1", "api_concurrency": 3,
+            "api_chunk_s": 600, "api_rate_per_min": 50, "api_retries": 3, "api_timeout_s": 120,
+            "draft_model": "", "clipboard_policy": "both"
         }
         self.settings = self.load()
 
     def load(self):
-        if os.path.exists(SETTINGS_FILE):
+        if not os.path.exists(self.path): return self.default.copy()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if not isinstance(stored, dict): raise ValueError("kein JSON-Objekt")
+            return {**self.default, **stored}
+        except (OSError, ValueError) as e:
+            # Beschädigte Datei nicht stillschweigend überschreiben, sondern zur Seite legen
+            broken = f"{self.path}.corrupt"
             try:
-                with open(SETTINGS_FILE, "r") as f:
-                    return {**self.default, **json.loads(f.read())}
-            except: pass
-        return self.default.copy()
+                os.replace(self.path, broken)
+            except OSError:
+                broken = None
+            self.load_error = f"{self.path}: {e}" + (f" (gesichert als {broken})" if broken else "")
+            print(f"[Config] Einstellungen beschädigt, Standardwerte aktiv - {self.load_error}")
+            return self.default.copy()
 
     def save(self):
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(self.settings, f, indent=4)
-            
+        """Sofort und atomar schreiben"""
+        with self._lock:
+            if self._timer: self._timer.cancel()
+            self._timer = None
+            data = json.dumps(self.settings, indent=4)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+
+    def flush(self):
+        """Ausstehenden verzögerten Schreibvorgang sofort ausführen (z.B. beim Beenden)"""
+        if self._timer is not None: self.save()
+
+    def _schedule_save(self):
+        if self.flush_delay <= 0: return self.save()
+        with self._lock:
+            if self._timer: self._timer.cancel()
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def add_listener(self, callback):
+        """callback(changed_keys: set) nach jeder Änderung, im Thread des Aufrufers"""
+        self._listeners.append(callback)
+
     def get(self, key): return self.settings.get(key)
-    def set(self, key, val): self.settings[key] = val; self.save()
+    def set(self, key, val): return self.update({key: val})
+
+    def update(self, values):
+        """Mehrere Schlüssel auf einmal setzen, ein Schreibvorgang; liefert die geänderten Schlüssel"""
+        changed = {k for k, v in values.items() if self.settings.get(k) != v}
+        if not changed: return changed
+        with self._lock:
+            self.settings.update({k: values[k] for k in changed})
+        self._schedule_save()
+        for callback in list(self._listeners):
+            callback(changed)
+        return changed
 
 class AudioTranscriber:
-    def __init__(self, config):
+    def __init__(self, config, audio_source=None):
         self.config = config
+        self.audio_source = audio_source  # None -> Mikrofon (SoundDeviceSource)
         self.model = None
-        self.recording = False
-        self.transcribing = False # NEU: Status für Transkription
-        self.cancel_flag = False    # NEU: Abbruch-Flag
-        self.data = []
+        self.models = ModelRegistry(config.get("model_cache_mb"))
+        self.current = None         # Job, der gerade aufgenommen wird
+        self.jobs = JobQueue(self._transcribe)
+        self._infer_owner = None     # Job, dessen Audio gerade im Modell steckt
+        self._infer_model = None     # ... und das Modell dazu (Entwurf oder Hauptmodell)
         self.signals = WorkerSignals()
+        self.tracer = Tracer(config, on_record=self.signals.trace.emit)
+        self.language = "de"
+        self._model_lock = threading.RLock() # Modell nie parallel aus zwei Threads nutzen
+        self.vad_stats = {"original_s": 0.0, "removed_s": 0.0}
+        self.job_stats = deque(maxlen=50)  # audio_s, rtf, latency_s der letzten Jobs
+        self._long = None            # Worker-Pool für lange Aufnahmen, erst bei Bedarf
+        self.cache = None            # ResultCache, erst bei Bedarf
+        config.add_listener(self._on_config_changed)
+        self._idle_timer = None
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+        self._load_future = None
+        # Wie oft musste nach der Aufnahme noch auf das Modell gewartet werden?
+        self.reload_stats = {"preloads": 0, "critical_path": 0}
         
         self.sd = None
         self.np = None
-        self.whisper = None
+        self.levels = None           # LevelMeter, Pegel für die Aufnahmeanzeige
+        self._armed = None           # ArmedStream im Dauerbereitschafts-Modus
+        self._api = None             # ApiTranscriber, erst im API-Modus
+        self._api_key = None
+        self._arm_lock = threading.Lock()
 
     def load_model(self, progress_callback=None):
         mode = self.config.get("active_mode")
         
-        if self.sd is None:
+        if self.np is None:
             if progress_callback: progress_callback.emit("Lade Audio-Treiber...", 10)
-            import sounddevice; self.sd = sounddevice
             import numpy; self.np = numpy
             import soundfile; self.sf = soundfile
+            try:
+                import sounddevice; self.sd = sounddevice
+            except (ImportError, OSError) as e:
+                # Kein PortAudio (z.B. Server im Batch-Betrieb): Aufnahme geht nicht, Dateien schon
+                print(f"[Audio] Kein Aufnahmegerät verfügbar: {e}")
 
-        if mode == "api": return
-        
-        if self.whisper is None:
-            if progress_callback: progress_callback.emit("Lade AI-Engine...", 30)
-            import whisper; self.whisper = whisper
+        if mode == "api":
+            # Statt eines Modells: HTTP-Verbindung schon jetzt aufbauen
+            if progress_callback: progress_callback.emit("Verbinde mit API...", 50)
+            self._api_client().warm()
+            if progress_callback: progress_callback.emit("Bereit!", 100)
+            return
         
-        size = self.config.get("local_model_size")
-        if not self.model:
-            if progress_callback: progress_callback.emit(f"Lade Modell {size}...", 50)
-            self.model = self.whisper.load_model(size)
+        engine = create_engine(self.config)
+        if self.model_key() != engine.key:
+            if progress_callback: progress_callback.emit(f"Lade Modell {engine.size} ({engine.name})...", 50)
+            # Lock: ein evtl. verdrängtes Modell darf nicht gerade noch transkribieren
+            with self._model_lock:
+                self.models.budget_mb = self.config.get("model_cache_mb")
+                self.model = self.models.get(engine)
+        draft = self._draft_engine()
+        if draft is not None:
+            # Entwurfsmodell gleich mitladen, damit schon der erste Entwurf sofort kommt
+            with self._model_lock:
+                self.models.get(draft, keep=(self.model_key(),))
+        self._touch()
             
         if progress_callback: progress_callback.emit("Bereit!", 100)
 
+    def _on_config_changed(self, changed):
+        """Nur betroffene Teile anpassen; Modellwechsel lädt MainWindow bzw. der nächste Job nach"""
+        if "model_cache_mb" in changed:
+            self.models.budget_mb = self.config.get("model_cache_mb")
+        if changed & {"result_cache_dir", "result_cache_mb"}:
+            self.cache = None
+        if "idle_unload_min" in changed:
+            self._touch()
+        if changed & {"always_armed", "preroll_ms"} and not self.recording:
+            self.arm()
+
+    def _touch(self):
+        """Idle-Timer neu starten - nach idle_unload_min ohne Nutzung wird das Modell freigegeben"""
+        minutes = float(self.config.get("idle_unload_min") or 0)
+        if self._idle_timer: self._idle_timer.cancel()
+        if minutes <= 0: return
+        self._idle_timer = threading.Timer(minutes * 60, self._on_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _on_idle(self):
+        if self.recording or self.transcribing:
+            return self._touch()
+        fallback = self.config.get("idle_fallback_model")
+        self._release_long()
+        with self._model_lock:
+            self.models.clear()
+            self.model = None
+            if fallback and self.config.get("active_mode") != "api":
+                # Statt ganz zu entladen auf ein kleines Modell zurückfallen
+                self.model = self.models.get(create_engine(self.config, size=fallback))
+        print(f"[Modelle] Idle: Modell {'auf ' + fallback + ' verkleinert' if self.model else 'entladen'}")
+
+    def _model_pending(self):
+        if self.config.get("active_mode") == "api": return self.np is None
+        engine = create_engine(self.config)
+        return self.model_key() != engine.key
+
+    def load_model_async(self, progress_callback=None):
+        """Startet ein ausstehendes Laden im Hintergrund und liefert das Future (None = nichts zu tun)"""
+        if self._load_future and not self._load_future.done(): return self._load_future
+        if not self._model_pending(): return None
+        self._load_future = self._loader.submit(self.load_model, progress_callback)
+        return self._load_future
+
+    def _wait_for_model(self):
+        """Auf ein laufendes Laden warten statt selbst synchron zu laden"""
+        future = self._load_future
+        if future is None: return
+        if not future.done():
+            self.reload_stats["critical_path"] += 1
+            s = self.reload_stats
+            print(f"[Modelle] Warte auf Modell nach Aufnahme ({s['critical_path']}/{s['preloads']} Preloads zu spät)")
+        self._load_future = None
+        future.result() # Ladefehler hier weiterreichen
+
+    def model_key(self):
+        if self.model is None: return None
+        key = self.model.key
+        # Inzwischen von der Registry verdrängt (LRU) -> gilt als nicht geladen
+        return key if key in self.models else None
+
+    @property
+    def recording(self):
+        return self.current is not None and self.current.recording
+
+    @property
+    def transcribing(self):
+        return len(self.jobs) > 0
+
+    def _source(self):
+        if self.audio_source is None:
+            from logic.audio_source import SoundDeviceSource
+            if self.sd is None:
+                import sounddevice; self.sd = sounddevice
+            self.audio_source = SoundDeviceSource(self.sd)
+        return self.audio_source
+
+    def arm(self):
+        """always_armed: Eingang dauerhaft offen halten (mit Pre-Roll), sonst einen offenen Stream schließen.
+        Nur aus der GUI aufrufen - Batch- und Pool-Worker laden zwar Modelle, nehmen aber nie auf."""
+        preroll_s = float(self.config.get("preroll_ms") or 0) / 1000
+        want = bool(self.config.get("always_armed"))
+        with self._arm_lock:
+            if self._armed and (not want or self._armed.preroll_s != preroll_s):
+                self._armed.close()
+                self._armed = None
+            if not want or self._armed is not None: return
+            from logic.armed_capture import ArmedStream
+            try:
+                armed = ArmedStream(self._source(), SAMPLE_RATE, preroll_s)
+                armed.open()
+            except Exception as e:
+                # Kein Gerät o.ä.: Aufnahme öffnet den Stream dann wie gewohnt selbst
+                print(f"[Audio] Dauerbereitschaft nicht möglich: {e}")
+                return
+            self._armed = armed
+
     def start_recording(self):
-        if self.sd is None: 
-            import sounddevice; self.sd = sounddevice
+        if self.np is None:
             import numpy; self.np = numpy
+        self._source()
+        # Normalerweise schon beim GUI-Start geöffnet (main.py), hier nur als Nachzügler
+        self.arm()
+        if self.levels is None:
+            from logic.level_meter import LevelMeter
+            self.levels = LevelMeter()
+        self.levels.reset()
 
-        self.recording = True
-        self.cancel_flag = False
-        self.data = []
-        threading.Thread(target=self._record_loop, daemon=True).start()
+        # Ausstehendes Laden (Start, Moduswechsel, Idle) läuft während der Aufnahme
+        if self.load_model_async(): self.reload_stats["preloads"] += 1
+        job = TranscriptionJob(None)
+        job.data = self._capture_buffer(job)
+        job.trace = self.tracer.begin(job.id)
+        if self.config.get("auto_stop"):
+            from logic.vad import Endpointer
+            job.endpointer = Endpointer(float(self.config.get("auto_stop_threshold")),
+                                        float(self.config.get("auto_stop_silence_s")),
+                                        float(self.config.get("auto_stop_min_speech_s")))
+        self.current = job
+        if self._streaming_enabled():
+            job.stream_thread = threading.Thread(target=self._stream_loop, args=(job,), daemon=True)
+            job.stream_thread.start()
+        threading.Thread(target=self._record_loop, args=(job,), daemon=True).start()
+
+    def _capture_buffer(self, job):
+        """RAM-Puffer oder - für sehr lange Aufnahmen - laufend auf die Platte auslagern"""
+        if not self.config.get("spill_to_disk"):
+            from logic.audio_buffer import CaptureBuffer
+            return CaptureBuffer(SAMPLE_RATE)
+        from logic.spill_buffer import SpillingBuffer
+        directory = self.config.get("spill_dir")
+        os.makedirs(directory, exist_ok=True)
+        # WAV: libsndfile aktualisiert den Header bei jedem flush, die Datei ist nach einem Absturz lesbar.
+        # FLAC ist kleiner, aber erst nach close() vollständig - nicht absturzsicher.
+        fmt = self.config.get("spill_format") or "wav"
+        path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{job.id}.{fmt}")
+        return SpillingBuffer(path, SAMPLE_RATE, float(self.config.get("spill_window_s")), fmt)
 
     def stop_recording(self):
-        self.recording = False
+        if self.current: self.current.recording = False
 
     def cancel_process(self):
-        """Bricht Aufnahme ODER Transkription ab"""
-        self.cancel_flag = True
-        self.recording = False
-        # Info: Die Transkription selbst (whisper.transcribe) läuft im C++ Kern und lässt sich schwer
-        # "sofort" killen, aber wir ignorieren das Ergebnis danach einfach.
+        """Bricht die laufende Aufnahme ab - oder, wenn keine läuft, die zuletzt eingereichte Transkription"""
+        if self.recording:
+            return self.cancel_job(self.current.id)
+        # Der zuletzt gestoppte Job - den hat der Nutzer gerade vor Augen
+        job = self.jobs.latest()
+        if job is not None: self.cancel_job(job.id)
+
+    def cancel_job(self, job_id):
+        """Bricht genau einen Job ab, die übrigen in der Warteschlange laufen weiter"""
+        job = self.current if self.current and self.current.id == job_id else self.jobs.find(job_id)
+        if job is None: return
+        job.cancelled = True
+        job.recording = False
+        # Im Worker-Prozess wird die laufende Inferenz wirklich beendet (Prozess wird neu gestartet).
+        # In-Process (whisper.transcribe) geht das nicht - dort ignorieren wir das Ergebnis danach einfach.
+        model = self._infer_model
+        if model is not None and self._infer_owner is job:
+            model.cancel()
 
-    def _record_loop(self):
+    def _record_loop(self, job):
         def callback(indata, frames, time, status):
-            if self.recording:
-                self.data.append(indata.copy())
-                # Lautstärke berechnen (RMS) und an GUI senden für Visualisierung
-                volume_norm = self.np.linalg.norm(indata) * 10
-                self.signals.amplitude.emit(volume_norm)
-
-        with self.sd.InputStream(samplerate=16000, channels=1, callback=callback):
-            while self.recording:
-                self.sd.sleep(50)
-        
-        # Wenn abgebrochen wurde, gar nicht erst transkribieren
-        if not self.cancel_flag:
-            self._transcribe()
-        else:
-            self.signals.status.emit("Abgebrochen")
-            self.signals.finished.emit("") # Leeres Ergebnis senden zum Resetten
-
-    def _transcribe(self):
-        self.transcribing = True
+            if job.recording:
+                job.data.write(indata)
+                # Pegel nur ablegen - die GUI holt ihn im eigenen Takt ab (levels.pull)
+                rms = self.levels.push(indata)
+                # Endpointing: nach anhaltender Stille selbst stoppen
+                if job.endpointer and job.endpointer.feed(rms, frames / SAMPLE_RATE):
+                    job.auto_stopped = True
+                    job.recording = False
+
+        with span(job.trace, "device_open"):
+            # Dauerbereitschaft: nur anhängen, der Pre-Roll kommt als erster Block
+            armed = self._armed
+            stream = armed.session(callback) if armed else self.audio_source.stream(SAMPLE_RATE, callback)
+            stream.__enter__()
+        try:
+            with span(job.trace, "capture"):
+                while job.recording:
+                    time.sleep(0.05)
+            job.stopped_at = time.perf_counter()
+            if job.trace:
+                job.trace.mark("stopped")
+                job.trace.meta["audio_s"] = round(job.data.seconds, 2)
+        finally:
+            with span(job.trace, "device_close"):
+                stream.__exit__(None, None, None)
+                job.data.close()
+
+        # Streaming-Worker das laufende Fenster fertig machen lassen, danach bleibt nur der Rest
+        if job.stream_thread is not None:
+            with span(job.trace, "stream_join"):
+                job.stream_thread.join()
+
+        if job.auto_stopped and not job.cancelled:
+            self.signals.auto_stopped.emit()
+        # Auch abgebrochene Jobs laufen durch die Queue, damit die Reihenfolge der Ergebnisse stimmt
+        if job.trace: job.trace.mark("submitted")
+        self.jobs.submit(job)
+
+    def _streaming_enabled(self):
+        return bool(self.config.get("streaming")) and self.config.get("active_mode") != "api"
+
+    def _find_cut(self, audio, target, search_s=2.0, frame_s=0.1):
+        """Sucht die leiseste Stelle kurz vor 'target', damit kein Wort zerschnitten wird"""
+        frame = int(frame_s * SAMPLE_RATE)
+        start = max(target // 2, target - int(search_s * SAMPLE_RATE))
+        region = audio[start:target]
+        n = len(region) // frame
+        if n < 2: return target
+        energy = self.np.square(region[:n * frame].reshape(n, frame)).mean(axis=1)
+        return start + int(self.np.argmin(energy)) * frame + frame // 2
+
+    def _trim(self, audio):
+        """VAD: Stille entfernen und mitzählen, wie viel Audio eingespart wurde"""
+        from logic.vad import trim_silence
+        vad = trim_silence(audio, SAMPLE_RATE)
+        self.vad_stats["original_s"] += vad.original_seconds
+        self.vad_stats["removed_s"] += vad.removed_seconds
+        print(f"[VAD] {vad.removed_seconds:.1f}s von {vad.original_seconds:.1f}s Stille entfernt")
+        return vad.audio
+
+    def _run_model(self, audio, job, stage="inference", size=None, trim=True):
+        """size: anderes Modell als das konfigurierte (Entwurf), kommt ebenfalls aus der Registry"""
+        if trim and self.config.get("vad_trim"):
+            with span(job.trace, "vad"):
+                audio = self._trim(audio)
+            if not len(audio): return ""
+        prompt = " ".join(job.stream_texts)[-200:] or None
+        with span(job.trace, "model_wait"):
+            self._wait_for_model()
+        with self._model_lock:
+            if job.cancelled: return ""
+            with span(job.trace, "model_load"):
+                if size: model = self.models.get(create_engine(self.config, size=size), keep=(self.model_key(),))
+                else: self.load_model(); model = self.model
+            self._infer_owner, self._infer_model = job, model
+            try:
+                start = time.perf_counter()
+                with span(job.trace, stage):
+                    return model.transcribe(audio, language=self.language, initial_prompt=prompt)
+            finally:
+                job.infer_s += time.perf_counter() - start
+                self._infer_owner = self._infer_model = None
+
+    def _use_long_audio(self, audio):
+        workers = int(self.config.get("long_audio_workers") or 0)
+        return workers > 1 and len(audio) >= float(self.config.get("long_audio_min_s")) * SAMPLE_RATE
+
+    def _run_long(self, audio, job):
+        """Lange Aufnahme: an leisen Stellen teilen und parallel in Worker-Prozessen transkribieren"""
+        from logic.long_audio import LongAudioTranscriber
+        if self.config.get("vad_trim"):
+            audio = self._trim(audio)
+        workers = int(self.config.get("long_audio_workers"))
+        key = (workers,) + tuple(self.config.get(k) for k in ("engine", "local_model_size", "compute_type", "cpu_threads"))
+        if self._long is None or self._long_key != key:
+            if self._long: self._long.shutdown()
+            self._long, self._long_key = LongAudioTranscriber(self.config, workers), key
+        start = time.perf_counter()
+        try:
+            return self._long.transcribe(audio, SAMPLE_RATE, float(self.config.get("long_audio_segment_s")),
+                                         cancelled=lambda: job.cancelled)
+        finally:
+            job.infer_s += time.perf_counter() - start
+            # Jeder Worker hält ein volles Modell außerhalb von model_cache_mb - nur für direkt folgende Jobs behalten
+            if len(self.jobs) <= 1: self._release_long()
+
+    def _release_long(self):
+        if self._long is None: return
+        self._long.shutdown()
+        self._long = self._long_key = None
+        print("[Lang] Worker-Pool beendet")
+
+    def _stream_loop(self, job):
+        """Transkribiert abgeschlossene Fenster im Hintergrund, während weiter aufgenommen wird"""
+        window = int(float(self.config.get("stream_window_s")) * SAMPLE_RATE)
+        while job.recording and not job.cancelled:
+            time.sleep(0.25)
+            if len(job.data) - job.stream_pos < window: continue
+            audio = job.data.read(job.stream_pos, job.stream_pos + window)
+            cut = self._find_cut(audio, window)
+            try:
+                text = self._run_model(audio[:cut], job, stage="stream_inference")
+            except Exception as e:
+                print(f"[Streaming] Fehler: {e}")
+                break
+            # Übrig gebliebenes Audio geht ins nächste Fenster bzw. an die finale Transkription
+            job.stream_pos += cut
+            if text and not job.cancelled:
+                job.stream_texts.append(text)
+                self.signals.partial.emit(" ".join(job.stream_texts))
+
+    def _transcribe_spilled(self, job, infer, window_s):
+        """Ausgelagerte Aufnahme fensterweise aus der Datei transkribieren - nie alles auf einmal im RAM"""
+        window = int(window_s * SAMPLE_RATE)
+        while len(job.data) - job.stream_pos > window and not job.cancelled:
+            with span(job.trace, "buffer_read"):
+                audio = job.data.read(job.stream_pos, job.stream_pos + window)
+            cut = self._find_cut(audio, window)
+            text = infer(audio[:cut], job)
+            # Wie beim Streaming: Texte sammeln, der Rest läuft danach über den normalen Weg
+            job.stream_pos += cut
+            if text and not job.cancelled:
+                job.stream_texts.append(text)
+                self.signals.partial.emit(" ".join(job.stream_texts))
+
+    def _api_client(self):
+        """Eine ApiTranscriber-Instanz (Session + Upload-Pool), neu nur wenn sich API-Einstellungen ändern"""
+        key = tuple(self.config.get(k) for k in ("api_base_url", "api_key", "api_model", "api_concurrency",
+                                                 "api_chunk_s", "api_rate_per_min", "api_retries", "api_timeout_s"))
+        if self._api is None or self._api_key != key:
+            from logic.api_backend import ApiTranscriber
+            if self._api: self._api.close()
+            self._api, self._api_key = ApiTranscriber(self.config), key
+        return self._api
+
+    def _api_infer(self, audio, job):
+        if self.config.get("vad_trim"):
+            with span(job.trace, "vad"):
+                audio = self._trim(audio)
+        if not len(audio): return ""
+        start = time.perf_counter()
+        try:
+            with span(job.trace, "api"):
+                return self._api_client().transcribe(audio, SAMPLE_RATE, self.language, cancelled=lambda: job.cancelled)
+        finally:
+            job.infer_s += time.perf_counter() - start
+
+    def _discard_recording(self, job):
+        """Aufnahmedatei nach erfolgreicher Transkription bzw. Abbruch löschen (außer mit spill_keep)"""
+        if job.data is None or not job.data.path or self.config.get("spill_keep"): return
+        try:
+            os.remove(job.data.path)
+        except OSError:
+            pass
+
+    def transcribe_audio(self, audio):
+        """Transkribiert fertiges Audio (16 kHz float32) synchron, ohne Queue und Signale (Batch, Benchmarks)"""
+        job = TranscriptionJob(None)
+        job.recording = False
+        return self._cached(audio, job, lambda: self._run_model(audio, job))
+
+    def _infer(self, audio, job):
+        if not len(audio): return ""
+        if self._use_long_audio(audio): return self._run_long(audio, job)
+        if self._two_pass(job): return self._draft_then_refine(audio, job)
+        return self._run_model(audio, job)
+
+    def _draft_engine(self):
+        """Engine des Entwurfsmodells - None, wenn keins gesetzt ist oder es nicht neben dem Hauptmodell ins Budget passt"""
+        draft = self.config.get("draft_model")
+        if not draft or draft == self.config.get("local_model_size"): return None
+        main, engine = create_engine(self.config), create_engine(self.config, size=draft)
+        # Sonst verdrängt der Entwurf das Hauptmodell und jeder Job lädt beide neu
+        if not self.models.fits(main.key, engine.key): return None
+        return engine
+
+    def _two_pass(self, job):
+        return not job.stream_texts and self._draft_engine() is not None
+
+    def _draft_then_refine(self, audio, job):
+        """Erst das kleine Entwurfsmodell (sofort ans UI), dann das konfigurierte Modell für den finalen Text"""
+        if self.config.get("vad_trim"):
+            with span(job.trace, "vad"):
+                audio = self._trim(audio)
+            if not len(audio): return ""
+        draft = self._run_model(audio, job, stage="draft", size=self.config.get("draft_model"), trim=False)
+        if job.cancelled: return ""
+        if job.trace and "stopped" in job.trace.marks:
+            job.trace.meta["draft_latency_s"] = round(time.perf_counter() - job.trace.marks["stopped"], 4)
+        self.signals.draft.emit(draft.strip())
+        return self._run_model(audio, job, trim=False)
+
+    def _cache_options(self):
+        """Alles, was bei gleichem Audio zu einem anderen Text führen kann"""
+        if self.config.get("active_mode") == "api":
+            return {"engine": "api", "base_url": self.config.get("api_base_url"), "model": self.config.get("api_model"),
+                    "language": self.language, "vad_trim": bool(self.config.get("vad_trim"))}
+        engine = create_engine(self.config)
+        return {"engine": engine.name, "size": engine.size, "compute_type": engine.compute_type,
+                "language": self.language, "vad_trim": bool(self.config.get("vad_trim"))}
+
+    def _cached(self, audio, job, compute):
+        """Ergebnis-Cache um die Inferenz: Treffer sparen das komplette Transkribieren"""
+        # Streaming-Reste hängen vom Prompt der vorherigen Fenster ab - nur ganze Aufnahmen cachen
+        if not self.config.get("result_cache") or job.stream_texts or not len(audio):
+            return compute()
+        if self.cache is None:
+            from logic.result_cache import ResultCache
+            self.cache = ResultCache(self.config.get("result_cache_dir"), float(self.config.get("result_cache_mb")))
+        with span(job.trace, "cache_lookup"):
+            key = self.cache.make_key(audio, self._cache_options())
+            text = self.cache.get(key)
+        if text is not None:
+            print(f"[Cache] Treffer ({self.cache.hits} Treffer / {self.cache.misses} Fehlschläge)")
+            return text
+        text = compute()
+        if not job.cancelled:
+            with span(job.trace, "cache_store"):
+                self.cache.put(key, text)
+        return text
+
+    def _emit_finished(self, job, text):
+        # Trace vor dem Signal übergeben, damit die GUI ihn in derselben Reihenfolge abholt
+        self.tracer.backend_done(job.trace)
+        if job.stopped_at is not None and not job.cancelled and job.data is not None and len(job.data):
+            # Leichte Kennzahlen pro Job, auch ohne Tracing (Diagnose-Fenster)
+            audio_s = job.data.seconds
+            self.job_stats.append({"job": job.id, "audio_s": round(audio_s, 2), "rtf": round(job.infer_s / audio_s, 4),
+                                   "latency_s": round(time.perf_counter() - job.stopped_at, 4)})
+        # Vor dem Signal: die GUI fragt beim Verarbeiten schon 'transcribing' für die übrigen Jobs ab
+        self.jobs.delivered(job)
+        self.signals.finished.emit(text)
+
+    def _emit_cancelled(self, job):
+        self._discard_recording(job)
+        self.signals.status.emit("Abgebrochen")
+        self._emit_finished(job, "") # Leeres Ergebnis senden zum Resetten
+
+    def _transcribe(self, job):
+        """Läuft im Queue-Worker, immer nur ein Job gleichzeitig"""
+        if job.trace: job.trace.since("queue_wait", "submitted")
+        if job.cancelled: return self._emit_cancelled(job)
         self.signals.status.emit("Verarbeite...")
         # Startsignal für Ladeanimation (wir nutzen progress mit -1 als Code für "Indeterminate/Laden")
         self.signals.progress.emit("Transkribiere...", -1) 
         
         try:
-            if not self.data: return
-
-            audio = self.np.concatenate(self.data, axis=0).astype(self.np.float32).flatten()
+            api = self.config.get("active_mode") == "api"
+            if job.data.path:
+                if api:
+                    # Ein Fenster reicht für alle parallelen Uploads des ApiTranscribers
+                    api_window = float(self.config.get("api_chunk_s") or 600) * max(1, int(self.config.get("api_concurrency") or 1))
+                    self._transcribe_spilled(job, self._api_infer, api_window)
+                else:
+                    self._transcribe_spilled(job, self._run_model, float(self.config.get("long_audio_segment_s")))
+            # Im Streaming-Modus ist alles bis auf den Rest schon transkribiert
+            with span(job.trace, "buffer_read"):
+                audio = job.pending_audio()
             
             # API oder Lokal
-            if self.config.get("active_mode") == "api":
-                # ... API Logik ...
-                text = "API Dummy Text"
-                time.sleep(2) # Simuliere Ladezeit
+            if api:
+                text = self._cached(audio, job, lambda: self._api_infer(audio, job))
             else:
-                if not self.model: self.load_model()
                 # Hier läuft die Berechnung. Wir checken danach, ob abgebrochen wurde.
-                result = self.model.transcribe(audio, language="de")
-                text = result["text"]
+                text = self._cached(audio, job, lambda: self._infer(audio, job))
+            text = " ".join(job.stream_texts + [text])
             
-            self.transcribing = False
+            self._touch()
             
             # Check ob USER währenddessen abgebrochen hat
-            if self.cancel_flag:
-                self.signals.status.emit("Abgebrochen")
-                self.signals.finished.emit("")
+            if job.cancelled:
+                self._emit_cancelled(job)
             else:
-                self.signals.finished.emit(text.strip())
+                self._discard_recording(job)
+                self._emit_finished(job, text.strip())
                 
         except Exception as e:
-            self.transcribing = False
-            self.signals.finished.emit(f"Fehler: {e}")
+            if job.cancelled:
+                self._emit_cancelled(job)
+            else:
+                # Ausgelagerte Aufnahme bleibt liegen und kann per "main.py batch" erneut transkribiert werden
+                if job.data.path: print(f"[Aufnahme] Gespeichert unter {job.data.path}")
+                self._emit_finished(job, f"Fehler: {e}")
 
 def get_asset_path(filename):
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
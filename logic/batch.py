@@ -0,0 +1,198 @@
+# Headless Batch-Transkription für SnapScribe
+# Verteilt Audiodateien auf einen Prozess-Pool (ein warmes Modell pro Worker) und schreibt
+# Ergebnisse sofort als JSONL oder .txt - bereits erledigte Dateien werden beim Neustart übersprungen.
+#
+#   python main.py batch memos/ -o memos.jsonl --workers 4 --model small --engine faster-whisper
+
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3")
+
+_transcriber = None  # Pro Worker-Prozess einmal angelegt
+
+def _lowpass(blocks, ratio, taps_per_ratio=32):
+    """
+    Tiefpass vor dem Heruntertakten: gefensterter Sinc (Blackman), per FFT blockweise gefaltet.
+    Ohne Filter falten Anteile über 8 kHz (Zischlaute) beim Interpolieren ins Sprachband.
+    Die Gruppenlaufzeit wird ausgeglichen - Ausgabe ist sample-genau so lang wie die Eingabe.
+    """
+    import numpy as np
+    n_taps = int(ratio * taps_per_ratio) | 1
+    delay = n_taps // 2
+    cutoff = 0.45 / ratio  # In Zyklen pro Eingangs-Sample, knapp unter der neuen Nyquist-Frequenz
+    h = 2 * cutoff * np.sinc(2 * cutoff * (np.arange(n_taps) - delay)) * np.blackman(n_taps)
+    h /= h.sum()
+    spectra = {}
+    tail = np.zeros(n_taps - 1, dtype=np.float32)
+    skip = delay
+    # Am Ende Nullen nachschieben, damit die letzten 'delay' Samples auch herauskommen
+    for mono in itertools.chain(blocks, [np.zeros(delay, dtype=np.float32)]):
+        x = np.concatenate((tail, mono))
+        n = 1 << (len(x) - 1).bit_length()
+        if n not in spectra: spectra[n] = np.fft.rfft(h, n)
+        y = np.fft.irfft(np.fft.rfft(x, n) * spectra[n], n)[n_taps - 1:len(x)].astype(np.float32)
+        tail = x[len(x) - (n_taps - 1):]
+        drop = min(skip, len(y))
+        skip -= drop
+        yield y[drop:]
+
+def read_audio(path, blocksize=16000 * 30):
+    """Liest eine Datei blockweise (soundfile) als 16 kHz mono int16 in einen CaptureBuffer"""
+    import numpy as np
+    import soundfile as sf
+    from logic.audio_buffer import CaptureBuffer
+    from logic.backend import SAMPLE_RATE
+
+    buf = CaptureBuffer(SAMPLE_RATE)
+    with sf.SoundFile(path) as f:
+        ratio = f.samplerate / SAMPLE_RATE
+        blocks = (block.mean(axis=1) for block in f.blocks(blocksize=blocksize, dtype="float32", always_2d=True))
+        if ratio > 1: blocks = _lowpass(blocks, ratio)
+        pos, offset, prev = 0.0, 0, None
+        for mono in blocks:
+            if not len(mono): continue
+            # Letztes Sample des Vorgängers voranstellen, damit die Interpolation über Blockgrenzen läuft
+            if prev is not None: mono = np.concatenate(([prev], mono))
+            end = offset + len(mono) - 1
+            k = int((end - pos) // ratio) + 1 if end >= pos else 0
+            positions = pos + ratio * np.arange(k)
+            out = np.interp(positions - offset, np.arange(len(mono)), mono)
+            buf.write(np.clip(out * 32768, -32768, 32767).astype(np.int16))
+            pos += k * ratio
+            prev, offset = mono[-1], end
+    return buf
+
+def _init_worker(overrides):
+    """Worker-Start: Config + AudioTranscriber anlegen und Modell vorladen"""
+    global _transcriber
+    from logic.backend import ConfigManager, AudioTranscriber
+    config = ConfigManager()
+    # Nur im Speicher überschreiben, settings.json bleibt unverändert
+    config.settings.update(overrides)
+    _transcriber = AudioTranscriber(config)
+    _transcriber.load_model()
+
+def _transcribe_file(path):
+    start = time.perf_counter()
+    data = read_audio(path)
+    cache = _transcriber.cache
+    hits = cache.hits if cache else 0
+    text = _transcriber.transcribe_audio(data.read())
+    cache = _transcriber.cache
+    return {"file": path, "text": text, "duration_s": round(data.seconds, 2),
+            "elapsed_s": round(time.perf_counter() - start, 2),
+            "cache_hit": bool(cache and cache.hits > hits)}
+
+def collect_files(inputs, extensions=AUDIO_EXTENSIONS):
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _dirs, names in os.walk(item):
+                files += [os.path.join(root, n) for n in sorted(names) if n.lower().endswith(extensions)]
+        elif os.path.isfile(item):
+            files.append(item)
+    return sorted(os.path.abspath(f) for f in files)
+
+def _txt_root(files):
+    """Gemeinsamer Ordner aller Eingaben - darunter wird die Struktur im Ausgabeordner gespiegelt"""
+    try:
+        return os.path.commonpath([os.path.dirname(f) for f in files])
+    except ValueError:
+        return "" # Verschiedene Laufwerke (Windows): vollen Pfad ohne Laufwerk spiegeln
+
+def _txt_path(out_dir, path, root):
+    """a/memo.wav -> out/a/memo.wav.txt: relativer Pfad samt Endung, damit gleichnamige Dateien sich nicht überschreiben"""
+    rel = os.path.relpath(path, root) if root else os.path.splitdrive(path)[1].lstrip("\\/")
+    return os.path.join(out_dir, rel + ".txt")
+
+def done_files(output, fmt):
+    """Dateien, für die schon ein Ergebnis existiert (Fehler werden erneut versucht)"""
+    if fmt == "txt" or not os.path.exists(output): return set()
+    done = set()
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue # Abgebrochene letzte Zeile nach einem Absturz
+            if "text" in entry: done.add(entry["file"])
+    return done
+
+def run(files, output, fmt="jsonl", workers=1, overrides=None):
+    overrides = dict(overrides or {})
+    overrides["worker_process"] = False # Wir sind schon in einem eigenen Prozess
+
+    done = done_files(output, fmt)
+    root = _txt_root(files)
+    if fmt == "txt":
+        os.makedirs(output, exist_ok=True)
+        todo = [f for f in files if not os.path.exists(_txt_path(output, f, root))]
+    else:
+        todo = [f for f in files if f not in done]
+    print(f"[Batch] {len(files) - len(todo)} von {len(files)} Dateien bereits erledigt, {len(todo)} offen")
+    if not todo: return 0
+
+    errors = cache_hits = 0
+    sink = open(output, "a", encoding="utf-8") if fmt == "jsonl" else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(overrides,)) as pool:
+            futures = {pool.submit(_transcribe_file, f): f for f in todo}
+            for i, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    entry = {"file": path, "error": str(e)}
+                    errors += 1
+                # Sofort schreiben, damit ein Abbruch nichts Erledigtes verliert
+                if sink:
+                    sink.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    sink.flush()
+                elif "text" in entry:
+                    target = _txt_path(output, path, root)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    # Erst vollständig schreiben, dann umbenennen - eine halbe Datei gälte beim Neustart als erledigt
+                    with open(target + ".part", "w", encoding="utf-8") as f:
+                        f.write(entry["text"] + "\n")
+                    os.replace(target + ".part", target)
+                cache_hits += bool(entry.get("cache_hit"))
+                print(f"[Batch] {i}/{len(todo)} {os.path.basename(path)}" + (f" FEHLER: {entry['error']}" if "error" in entry else ""))
+    finally:
+        if sink: sink.close()
+    print(f"[Batch] Fertig: {cache_hits} von {len(todo)} Dateien aus dem Cache, {errors} Fehler")
+    return 1 if errors else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="snapscribe batch", description="Audiodateien ohne GUI transkribieren")
+    parser.add_argument("inputs", nargs="+", help="Dateien oder Ordner")
+    parser.add_argument("-o", "--output", default="transcripts.jsonl", help="JSONL-Datei bzw. Ordner bei --format txt")
+    parser.add_argument("--format", choices=["jsonl", "txt"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--model", help="Modellgröße, z.B. base, small, medium, large-v3")
+    parser.add_argument("--engine", help="whisper oder faster-whisper")
+    parser.add_argument("--compute-type", help="z.B. int8 (faster-whisper)")
+    parser.add_argument("--threads", type=int, help="CPU-Threads pro Worker")
+    args = parser.parse_args(argv)
+
+    overrides = {"active_mode": "local"}
+    if args.model: overrides["local_model_size"] = args.model
+    if args.engine: overrides["engine"] = args.engine
+    if args.compute_type: overrides["compute_type"] = args.compute_type
+    if args.threads is not None: overrides["cpu_threads"] = args.threads
+
+    files = collect_files(args.inputs)
+    if not files:
+        print("[Batch] Keine Audiodateien gefunden")
+        return 1
+    return run(files, args.output, args.format, args.workers, overrides)
+
+if __name__ == "__main__":
+    sys.exit(main())
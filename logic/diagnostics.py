@@ -0,0 +1,50 @@
+# Laufzeit-Diagnose für SnapScribe: Prozess-RAM, geladene Modelle, letzte Jobs, Aufnahmepuffer
+
+import os
+import sys
+
+def process_rss_mb():
+    """Aktueller Resident Set Size des Prozesses in MB (Windows, Linux, sonst Peak-Wert)"""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize / (1024 * 1024)
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def snapshot(transcriber, last_jobs=10):
+    """Alle Werte für das Diagnose-Fenster - darf im Hintergrund-Thread laufen"""
+    job = transcriber.current
+    recording = job is not None and job.recording
+    pool = transcriber._long  # Worker-Pool für lange Aufnahmen, eigene Prozesse mit je einem Modell
+    return {
+        "rss_mb": process_rss_mb(),
+        "models": [{"key": "/".join(map(str, key)), "mb": round(mb)} for key, mb in transcriber.models.resident()],
+        "models_budget_mb": transcriber.models.budget_mb,
+        "active_model": "/".join(map(str, transcriber.model_key())) if transcriber.model_key() else None,
+        "long_pool": {"key": "/".join(map(str, pool.key)), "workers": pool.workers,
+                      "mb": round(pool.workers * transcriber.models.estimate_mb(pool.key))} if pool else None,
+        "buffer_s": job.data.seconds if recording else 0.0,
+        "buffer_mb": job.data.nbytes / (1024 * 1024) if recording else 0.0,
+        "queue": len(transcriber.jobs),
+        "jobs": list(transcriber.job_stats)[-last_jobs:],
+        "vad_removed_s": transcriber.vad_stats["removed_s"],
+        "cache": transcriber.cache.stats() if transcriber.cache else None,
+    }
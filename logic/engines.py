@@ -0,0 +1,79 @@
+# Inference-Engines für SnapScribe
+# Gemeinsame Schnittstelle, damit AudioTranscriber nicht an eine Whisper-Implementierung gebunden ist
+
+class BaseEngine:
+    """Basis für alle Engines: laden, transkribieren (16 kHz mono float32), entladen"""
+    name = ""
+    compute_types = []
+
+    def __init__(self, size, compute_type="int8", cpu_threads=0):
+        self.size = size
+        self.compute_type = compute_type
+        self.cpu_threads = int(cpu_threads or 0)
+        self.model = None
+
+    @property
+    def key(self):
+        """Alles, was das geladene Modell bestimmt - Schlüssel in der ModelRegistry"""
+        return (self.name, self.size, self.compute_type, self.cpu_threads)
+
+    def load(self):
+        raise NotImplementedError
+
+    def transcribe(self, audio, language=None, initial_prompt=None):
+        raise NotImplementedError
+
+    def unload(self):
+        self.model = None
+
+    def cancel(self):
+        """Laufende Transkription abbrechen - im selben Prozess nicht möglich, siehe ProcessEngine"""
+        pass
+
+class WhisperEngine(BaseEngine):
+    """Original openai-whisper (PyTorch)"""
+    name = "whisper"
+    compute_types = ["float32"]
+
+    def load(self):
+        import whisper
+        if self.cpu_threads:
+            import torch; torch.set_num_threads(self.cpu_threads)
+        self.model = whisper.load_model(self.size)
+
+    def transcribe(self, audio, language=None, initial_prompt=None):
+        result = self.model.transcribe(audio, language=language, initial_prompt=initial_prompt)
+        return result["text"].strip()
+
+class FasterWhisperEngine(BaseEngine):
+    """faster-whisper (CTranslate2), auf CPU mit int8 deutlich schneller und sparsamer"""
+    name = "faster-whisper"
+    compute_types = ["int8", "int8_float32", "float32"]
+
+    def load(self):
+        from faster_whisper import WhisperModel
+        # cpu_threads=0 -> CTranslate2 wählt selbst
+        self.model = WhisperModel(self.size, device="cpu", compute_type=self.compute_type,
+                                  cpu_threads=self.cpu_threads)
+
+    def transcribe(self, audio, language=None, initial_prompt=None):
+        segments, _info = self.model.transcribe(audio, language=language, initial_prompt=initial_prompt)
+        # segments ist ein Generator, erst hier läuft die eigentliche Dekodierung
+        return "".join(seg.text for seg in segments).strip()
+
+ENGINES = {
+    WhisperEngine.name: WhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine,
+}
+
+def create_engine(config, size=None):
+    """Erzeugt die in der Config gewählte Engine (noch nicht geladen)"""
+    cls = ENGINES.get(config.get("engine"), WhisperEngine)
+    compute_type = config.get("compute_type")
+    if compute_type not in cls.compute_types:
+        compute_type = cls.compute_types[0]
+    size = size or config.get("local_model_size")
+    if config.get("worker_process"):
+        from logic.worker_process import ProcessEngine
+        return ProcessEngine(cls.name, size, compute_type, config.get("cpu_threads"))
+    return cls(size, compute_type, config.get("cpu_threads"))
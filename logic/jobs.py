@@ -0,0 +1,79 @@
+# Aufnahme-Jobs und Transkriptions-Warteschlange für SnapScribe
+# Trennt Aufnahme (Producer) von Inferenz (ein Worker-Thread), damit schon das nächste Diktat laufen kann
+
+import itertools
+import queue
+import threading
+
+class TranscriptionJob:
+    """Eine Aufnahme samt allem, was ihre Transkription braucht"""
+    _ids = itertools.count(1)
+
+    def __init__(self, data):
+        self.id = next(self._ids)
+        self.data = data            # CaptureBuffer
+        self.recording = True
+        self.cancelled = False
+        self.auto_stopped = False
+        self.endpointer = None
+        self.stream_thread = None
+        self.stream_texts = []      # Schon transkribierte Fenster (Streaming)
+        self.stream_pos = 0         # Ab hier ist noch nichts transkribiert
+        self.trace = None           # JobTrace, wenn Tracing aktiv ist
+        self.stopped_at = None      # perf_counter beim Stopp - immer erfasst, für die Diagnose
+        self.infer_s = 0.0          # Reine Modell-/API-Zeit
+
+    def pending_audio(self):
+        return self.data.read(self.stream_pos)
+
+class JobQueue:
+    """FIFO mit genau einem Worker - Ergebnisse kommen in Aufnahme-Reihenfolge"""
+    def __init__(self, handler):
+        self._handler = handler
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._waiting = []
+        self._unfinished = set()    # Eingereicht, Ergebnis noch nicht ausgeliefert
+        self.active = None
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._unfinished)
+
+    def submit(self, job):
+        with self._lock:
+            self._waiting.append(job)
+            self._unfinished.add(job)
+        self._queue.put(job)
+
+    def delivered(self, job):
+        """Ergebnis ist unterwegs zur GUI - der Job zählt ab jetzt nicht mehr als offen"""
+        with self._lock:
+            self._unfinished.discard(job)
+
+    def latest(self):
+        """Zuletzt eingereichter, noch nicht abgebrochener Job"""
+        with self._lock:
+            for job in reversed([self.active] + self._waiting):
+                if job is not None and not job.cancelled: return job
+        return None
+
+    def find(self, job_id):
+        with self._lock:
+            for job in [self.active] + self._waiting:
+                if job is not None and job.id == job_id: return job
+        return None
+
+    def _loop(self):
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                self._waiting.remove(job)
+                self.active = job
+            try:
+                self._handler(job)
+            finally:
+                with self._lock:
+                    self.active = None
+                    self._unfinished.discard(job)
@@ -0,0 +1,42 @@
+# Pegelmessung für die Aufnahmeanzeige in SnapScribe
+# Der Audio-Callback legt pro Block nur RMS und Spitze in einen kleinen Ring, die GUI holt
+# die seit dem letzten Frame angefallenen Werte gesammelt ab (statt einem Qt-Signal pro Block).
+
+import numpy as np
+
+class LevelMeter:
+    """Ein Schreiber (Audio-Callback), ein Leser (GUI-Timer); Werte normiert auf [0, 1]"""
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._sumsq = np.zeros(capacity, dtype=np.float64)
+        self._peak = np.zeros(capacity, dtype=np.float32)
+        self._frames = np.zeros(capacity, dtype=np.int64)
+        self._written = 0
+        self._read = 0
+
+    def reset(self):
+        self._read = self._written
+
+    def push(self, block):
+        """int16-Block eintragen, liefert dessen RMS (für das Endpointing)"""
+        frames = len(block)
+        if frames == 0: return 0.0
+        norm = float(np.linalg.norm(block)) / 32768
+        i = self._written % self.capacity
+        self._sumsq[i] = norm * norm
+        self._peak[i] = max(int(block.max()), -int(block.min())) / 32768
+        self._frames[i] = frames
+        # Zähler erst nach den Werten erhöhen - der Leser sieht nur fertige Einträge
+        self._written += 1
+        return norm / frames ** 0.5
+
+    def pull(self):
+        """(rms, peak) über alle Blöcke seit dem letzten Aufruf, None wenn nichts Neues da ist"""
+        written = self._written
+        start = max(self._read, written - self.capacity)
+        self._read = written
+        if start >= written: return None
+        idx = np.arange(start, written) % self.capacity
+        frames = self._frames[idx].sum()
+        if frames == 0: return None
+        return float(np.sqrt(self._sumsq[idx].sum() / frames)), float(self._peak[idx].max())
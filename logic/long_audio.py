@@ -0,0 +1,101 @@
+# Parallele Transkription langer Aufnahmen
+# Schneidet das Audio an leisen Stellen nahe der 30-Sekunden-Fenstergrenzen, transkribiert die
+# Stücke gleichzeitig in Worker-Prozessen und setzt den Text in Reihenfolge wieder zusammen.
+
+import multiprocessing as mp
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from logic import batch
+from logic.engines import create_engine
+from logic.vad import frame_rms
+
+WINDOW_S = 30  # Whisper rechnet in 30-Sekunden-Fenstern
+
+def split_points(audio, samplerate=16000, segment_s=120, search_s=5.0, frame_s=0.05):
+    """
+    Grenzen (Sample-Indizes) für Stücke von ca. segment_s Sekunden.
+    Jede Grenze liegt an der leisesten Stelle im Bereich +-search_s um ein Vielfaches von 30 s.
+    """
+    segment_s = max(WINDOW_S, int(segment_s // WINDOW_S) * WINDOW_S)
+    frame = int(samplerate * frame_s)
+    rms = frame_rms(audio, samplerate, frame_s)
+    bounds = [0]
+    target = segment_s * samplerate
+    while target < len(audio) - segment_s * samplerate // 4:
+        lo = max(bounds[-1] + frame, target - int(search_s * samplerate)) // frame
+        hi = min(len(rms), (target + int(search_s * samplerate)) // frame)
+        cut = (lo + int(np.argmin(rms[lo:hi]))) * frame if hi > lo else target
+        bounds.append(cut)
+        target = cut + segment_s * samplerate
+    bounds.append(len(audio))
+    return bounds
+
+def _words(text):
+    return [re.sub(r"[^\w]", "", w.lower()) for w in text.split()]
+
+def merge_texts(texts, max_overlap=20):
+    """Fügt Teiltexte zusammen und entfernt Wörter, die an einer Naht doppelt transkribiert wurden"""
+    merged = []
+    for text in texts:
+        words = text.split()
+        if merged and words:
+            left, right = _words(" ".join(merged[-max_overlap:])), _words(" ".join(words[:max_overlap]))
+            # Längste Wortfolge, mit der der linke Text endet und der rechte beginnt
+            for k in range(min(len(left), len(right)), 0, -1):
+                if left[-k:] == right[:k]:
+                    words = words[k:]
+                    break
+        merged += words
+    return " ".join(merged)
+
+def _transcribe_span(shm_name, length, start, end):
+    """Läuft im Pool-Worker: Ausschnitt aus dem Shared Memory kopieren und transkribieren"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        audio = np.array(np.ndarray((length,), dtype=np.float32, buffer=shm.buf)[start:end])
+    finally:
+        shm.close()
+    return batch._transcriber.transcribe_audio(audio)
+
+class LongAudioTranscriber:
+    """Hält einen Pool warmer Worker (je ein Modell) für lange Aufnahmen"""
+    def __init__(self, config, workers):
+        self.workers = workers
+        overrides = {k: config.get(k) for k in ("engine", "local_model_size", "compute_type")}
+        # Bereits getrimmt, schon in eigenem Prozess; CPU-Kerne auf die Worker aufteilen
+        overrides.update(active_mode="local", vad_trim=False, worker_process=False, streaming=False,
+                         cpu_threads=config.get("cpu_threads") or max(1, (os.cpu_count() or 1) // workers))
+        self.overrides = overrides
+        # Modell pro Worker als ModelRegistry-Schlüssel - für die RAM-Schätzung in der Diagnose
+        self.key = create_engine(overrides).key
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                                        initializer=batch._init_worker, initargs=(overrides,))
+
+    def transcribe(self, audio, samplerate=16000, segment_s=120, overlap_s=1.0, cancelled=lambda: False):
+        bounds = split_points(audio, samplerate, segment_s)
+        overlap = int(overlap_s * samplerate)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+            # Jedes Stück etwas in das nächste hinein verlängern, die Dopplung entfernt merge_texts
+            futures = [self.pool.submit(_transcribe_span, shm.name, len(audio), s, min(len(audio), e + overlap))
+                       for s, e in zip(bounds[:-1], bounds[1:])]
+            texts = []
+            for future in futures:
+                if cancelled():
+                    for f in futures: f.cancel()
+                    return ""
+                texts.append(future.result())
+        finally:
+            shm.close()
+            shm.unlink()
+        print(f"[Lang] {len(texts)} Stücke parallel auf {self.workers} Workern transkribiert")
+        return merge_texts(texts)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
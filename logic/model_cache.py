@@ -0,0 +1,69 @@
+# Modell-Registry für SnapScribe
+# Hält zuletzt genutzte Modelle im RAM (LRU), begrenzt durch ein Speicherbudget
+
+import threading
+from collections import OrderedDict
+
+# Grobe RAM-Schätzung in MB bei float32 (Gewichte + Laufzeit-Overhead)
+MODEL_SIZE_MB = {"tiny": 150, "base": 300, "small": 1000, "medium": 3000, "large-v3": 6000}
+# int8 speichert die Gewichte in einem Viertel des Platzes, dazu kommt etwas Overhead
+COMPUTE_FACTOR = {"int8": 0.35, "int8_float32": 0.35, "float32": 1.0}
+
+class ModelRegistry:
+    """Schlüssel ist engine.key (engine, size, compute_type, cpu_threads), Verdrängung nach LRU sobald das Budget voll ist"""
+    def __init__(self, budget_mb=4000):
+        self.budget_mb = budget_mb
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_mb(key):
+        _engine, size, compute_type = key[:3]
+        return MODEL_SIZE_MB.get(size, 1000) * COMPUTE_FACTOR.get(compute_type, 1.0)
+
+    def __contains__(self, key):
+        return key in self._models
+
+    def fits(self, *keys):
+        """Passen diese Modelle zusammen ins Budget?"""
+        return sum(self.estimate_mb(k) for k in set(keys)) <= self.budget_mb
+
+    def get(self, engine, keep=()):
+        """Liefert das geladene Modell zu 'engine' - aus dem Cache oder frisch geladen; 'keep' wird nie verdrängt"""
+        key = engine.key
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+            # Vor dem Laden Platz schaffen, damit der RAM-Peak im Budget bleibt
+            self._evict(self.budget_mb - self.estimate_mb(key), keep)
+            engine.load()
+            self._models[key] = engine
+            return engine
+
+    def _evict(self, limit_mb, keep=()):
+        for key in [k for k in self._models if k not in keep]:
+            if self.used_mb() <= limit_mb: break
+            self._models.pop(key).unload()
+            print(f"[Modelle] {key} entladen (LRU)")
+
+    def evict(self, key):
+        with self._lock:
+            engine = self._models.pop(key, None)
+            if engine: engine.unload()
+
+    def clear(self):
+        with self._lock:
+            self._evict(-1)
+
+    def used_mb(self):
+        return sum(self.estimate_mb(k) for k in self._models)
+
+    def resident(self):
+        """Liste (key, geschätzte MB) der geladenen Modelle, zuletzt genutztes zuletzt"""
+        # Ohne Lock (der ist während eines Ladevorgangs lange belegt); bei gleichzeitiger Änderung neu lesen
+        while True:
+            try:
+                return [(k, self.estimate_mb(k)) for k in list(self._models)]
+            except RuntimeError:
+                continue
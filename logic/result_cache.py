@@ -0,0 +1,93 @@
+# Inhaltsadressierter Ergebnis-Cache für SnapScribe
+# Gleiches Audio + gleiche Decode-Optionen -> Text direkt von der Platte statt erneuter Inferenz
+
+import hashlib
+import json
+import os
+import threading
+
+class ResultCache:
+    """Eine Datei pro Ergebnis (<hash>.txt), Verdrängung nach LRU (mtime) sobald max_mb überschritten ist"""
+    def __init__(self, directory, max_mb=50):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._size = None # Geschätzte Gesamtgröße; None = beim nächsten put einmal nachzählen
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(audio, options):
+        """SHA-256 über die PCM-Daten plus die Optionen, die das Ergebnis beeinflussen"""
+        h = hashlib.sha256(memoryview(audio).cast("B"))
+        h.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".txt")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            os.utime(path) # mtime = zuletzt benutzt
+        except OSError:
+            with self._lock: self.misses += 1
+            return None
+        with self._lock: self.hits += 1
+        return text
+
+    def put(self, key, text):
+        """Speichert ein Ergebnis; Plattenfehler werden nur protokolliert - der Cache darf nie den Job kosten"""
+        path = self._path(key)
+        # Atomar schreiben: paralleler Batch-Worker oder Absturz hinterlässt keine halben Dateien
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[Cache] Ergebnis nicht gespeichert: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            # Verzeichnis nur auflisten, wenn die laufende Schätzung das Budget überschreitet
+            if self._size is None: self._size = self._evict(float("inf"))
+            else: self._size += size
+            # Auf 90% herunter verdrängen, damit nicht jedes weitere put gleich wieder scannt
+            if self._size > self.max_bytes: self._size = self._evict(self.max_bytes * 0.9)
+
+    def _evict(self, max_bytes):
+        """Älteste Einträge löschen bis max_bytes eingehalten sind; liefert die verbleibende Größe"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError as e:
+            print(f"[Cache] Verzeichnis nicht lesbar: {e}")
+            return 0
+        for name in names:
+            if not name.endswith(".txt"): continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue # Gerade von einem anderen Prozess entfernt
+            entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _mtime, size, name in sorted(entries):
+            if total <= max_bytes: break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue # Bleibt liegen und zählt weiter mit
+            total -= size
+        return total
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
@@ -0,0 +1,104 @@
+# Aufnahme-Puffer mit Auslagerung auf die Platte für SnapScribe
+# Für sehr lange Aufnahmen: der Audio-Callback schreibt nur in ein festes RAM-Fenster, ein Writer-Thread
+# streamt die Samples laufend per soundfile in eine WAV-Datei. Der Speicherbedarf bleibt konstant, und nach
+# einem Absturz liegt die Aufnahme bis auf die letzten Zehntelsekunden lesbar auf der Platte (der WAV-Header
+# wird bei jedem flush nachgeführt; FLAC geht auch, ist aber erst nach close() wieder lesbar).
+
+import threading
+
+import numpy as np
+import soundfile as sf
+
+_SCALE = np.float32(1.0 / 32768)
+
+class SpillingBuffer:
+    """Gleiche Schnittstelle wie CaptureBuffer; Daten älter als window_seconds nur noch in der Datei"""
+    def __init__(self, path, samplerate=16000, window_seconds=60, fmt="wav"):
+        self.path = path
+        self.samplerate = samplerate
+        self._ring = np.empty(int(samplerate * window_seconds), dtype=np.int16)
+        self._length = 0    # Gesamtzahl Samples
+        self._flushed = 0   # Davon schon in der Datei
+        self.dropped = 0    # Samples, die der Writer nicht rechtzeitig abholen konnte
+        self._file = sf.SoundFile(path, "w", samplerate, 1, "PCM_16", format=fmt.upper())
+        self._file_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def seconds(self):
+        return self._length / self.samplerate
+
+    @property
+    def nbytes(self):
+        return self._ring.nbytes
+
+    def write(self, block):
+        """Kopiert einen Block (frames x 1, int16) ins RAM-Fenster - keine Plattenzugriffe im Callback"""
+        src = block.reshape(-1)[-len(self._ring):]
+        size = len(self._ring)
+        pos = self._length % size
+        first = min(len(src), size - pos)
+        self._ring[pos:pos + first] = src[:first]
+        self._ring[:len(src) - first] = src[first:]
+        # Länge erst nach dem Schreiben erhöhen, damit Leser nie halbfertige Daten sehen
+        self._length += len(block)
+
+    def _flush(self):
+        end = self._length
+        size = len(self._ring)
+        if end - self._flushed > size:
+            # Writer zu langsam (Platte blockiert) - das Überschriebene ist verloren, mit Stille auffüllen
+            lost = end - size - self._flushed
+            self.dropped += lost
+            self._file.write(np.zeros(lost, dtype=np.int16))
+            self._flushed += lost
+            print(f"[Aufnahme] {lost / self.samplerate:.1f}s konnten nicht rechtzeitig gespeichert werden")
+        while self._flushed < end:
+            pos = self._flushed % size
+            n = min(end - self._flushed, size - pos)
+            self._file.write(self._ring[pos:pos + n])
+            self._flushed += n
+        self._file.flush()
+
+    def _write_loop(self):
+        while not self._closed.wait(0.2):
+            with self._file_lock:
+                self._flush()
+
+    def close(self):
+        """Aufnahme beendet: Rest schreiben und Datei abschließen"""
+        if self._closed.is_set(): return
+        self._closed.set()
+        self._writer.join()
+        with self._file_lock:
+            self._flush()
+            self._file.close()
+
+    def read(self, start=0, end=None):
+        """[start, end) als float32 - aus dem RAM-Fenster, sonst blockweise aus der Datei"""
+        end = self._length if end is None else min(end, self._length)
+        out = np.empty(max(0, end - start), dtype=np.float32)
+        if start >= end: return out
+        size = len(self._ring)
+        # Eine Sekunde Abstand: der Callback darf parallel weiterschreiben
+        if start >= self._length - size + self.samplerate:
+            o = 0
+            while start < end:
+                pos = start % size
+                n = min(end - start, size - pos)
+                np.multiply(self._ring[pos:pos + n], _SCALE, out=out[o:o + n])
+                start += n
+                o += n
+            return out
+        with self._file_lock:
+            # Noch nicht Geschriebenes sofort nachziehen (nach close() ist schon alles in der Datei)
+            if not self._file.closed and self._flushed < end: self._flush()
+        with sf.SoundFile(self.path) as f:
+            f.seek(start)
+            f.read(len(out), dtype="float32", out=out)
+        return out
@@ -0,0 +1,70 @@
+# Startzeit-Messung und priorisiertes Vorladen für SnapScribe
+# main.py importiert dieses Modul als erstes, T0 ist damit (fast) der Programmstart. Im PyInstaller-Build
+# fehlt nur die Zeit des Bootloaders davor.
+
+import importlib
+import json
+import sys
+import threading
+import time
+
+T0 = time.perf_counter()
+
+# Reihenfolge = Priorität: erst was eine Aufnahme braucht, dann die Zwischenablage, zuletzt die Engine.
+# Das Modell selbst lädt danach load_model_async.
+PRELOAD = {
+    "whisper": ["numpy", "sounddevice", "soundfile", "pyperclip", "whisper"],
+    "faster-whisper": ["numpy", "sounddevice", "soundfile", "pyperclip", "faster_whisper"],
+}
+PRELOAD_API = ["numpy", "sounddevice", "soundfile", "pyperclip", "requests"]
+
+class StartupReport:
+    """Zeitmarken (ms seit T0) und Importdauern; report() fasst alles zusammen"""
+    def __init__(self):
+        self.marks = {}
+        self.imports = []
+        self._lock = threading.Lock()
+
+    def mark(self, name):
+        with self._lock:
+            self.marks.setdefault(name, round((time.perf_counter() - T0) * 1000, 1))
+
+    def timed_import(self, name):
+        """Modul importieren und Dauer festhalten; fehlende Pakete sind kein Fehler"""
+        cached = name in sys.modules
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            error = None
+        except (ImportError, OSError) as e:
+            error = str(e)
+        entry = {"module": name, "ms": round((time.perf_counter() - start) * 1000, 1),
+                 "thread": threading.current_thread().name, "cached": cached}
+        if error: entry["error"] = error
+        with self._lock:
+            self.imports.append(entry)
+
+    def preload(self, config):
+        """Schwere Module nach Priorität im aufrufenden (Hintergrund-)Thread importieren"""
+        names = PRELOAD_API if config.get("active_mode") == "api" else \
+            PRELOAD.get(config.get("engine"), PRELOAD["whisper"])
+        for name in names:
+            self.timed_import(name)
+            if name == "pyperclip": self.mark("capture_ready")
+
+    def report(self):
+        return {"marks": dict(sorted(self.marks.items(), key=lambda kv: kv[1])), "imports": list(self.imports),
+                "modules_loaded": len(sys.modules), "frozen": bool(getattr(sys, "frozen", False))}
+
+    def write(self, path, budget_ms=0):
+        """Bericht ausgeben und als JSON speichern; warnt, wenn das Tray länger als budget_ms brauchte"""
+        data = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print("[Start] " + ", ".join(f"{k} {v:.0f} ms" for k, v in data["marks"].items()))
+        for entry in sorted(data["imports"], key=lambda e: -e["ms"]):
+            if not entry["cached"]: print(f"[Start]   import {entry['module']}: {entry['ms']:.0f} ms")
+        tray = data["marks"].get("tray")
+        if budget_ms and tray is not None and tray > budget_ms:
+            print(f"[Start] WARNUNG: Tray nach {tray:.0f} ms, Budget {budget_ms} ms")
+        return data
@@ -0,0 +1,108 @@
+# Zeitmessung pro Verarbeitungsschritt für SnapScribe
+# Jeder Job bekommt (falls aktiviert) einen JobTrace, in den die Stufen ihre Dauer eintragen.
+# Fertige Traces landen als JSONL-Zeile in einer Datei, im Verlauf (für p50/p95) und optional in einem Qt-Signal.
+# Deaktiviert ist job.trace None und span() liefert einen geteilten Null-Kontext - keine Zeitmessung, keine Allokation.
+
+import contextlib
+import json
+import threading
+import time
+from collections import deque
+
+_NULL = contextlib.nullcontext()
+
+class JobTrace:
+    """Dauer pro Stufe (Sekunden) für einen Job; wiederholte Stufen werden aufsummiert"""
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.created = time.time()
+        self.t0 = time.perf_counter()
+        self.spans = {}
+        self.marks = {}
+        self.meta = {}               # z.B. audio_s für den Real-Time-Factor
+
+    def add(self, stage, seconds):
+        self.spans[stage] = self.spans.get(stage, 0.0) + seconds
+
+    def mark(self, name):
+        self.marks[name] = time.perf_counter()
+
+    def since(self, stage, mark):
+        """Zeit seit einer Marke als Stufe eintragen (z.B. Wartezeit in der Queue)"""
+        if mark in self.marks: self.add(stage, time.perf_counter() - self.marks[mark])
+
+    def to_dict(self):
+        now = time.perf_counter()
+        record = {"job": self.job_id, "created": round(self.created, 3), "total_s": round(now - self.t0, 4),
+                  "spans": {k: round(v, 4) for k, v in self.spans.items()}, **self.meta}
+        if "stopped" in self.marks:
+            record["latency_s"] = round(now - self.marks["stopped"], 4)  # Stop bis Text
+        audio_s = self.meta.get("audio_s")
+        if audio_s:
+            infer = sum(self.spans.get(k, 0.0) for k in ("inference", "stream_inference", "api"))
+            record["rtf"] = round(infer / audio_s, 4)
+        return record
+
+class _Span:
+    __slots__ = ("trace", "stage", "start")
+
+    def __init__(self, trace, stage):
+        self.trace = trace
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.trace.add(self.stage, time.perf_counter() - self.start)
+
+def span(trace, stage):
+    """with span(job.trace, "inference"): ... - ohne Trace ein No-Op"""
+    return _NULL if trace is None else _Span(trace, stage)
+
+class Tracer:
+    def __init__(self, config, on_record=None, history=500):
+        self.config = config
+        self.on_record = on_record
+        self.history = deque(maxlen=history)
+        self.ui_attached = False     # MainWindow ergänzt UI-Stufen und schließt den Trace selbst ab
+        self._ui_pending = deque()
+        self._lock = threading.Lock()
+
+    def begin(self, job_id):
+        if not self.config.get("trace_enabled"): return None
+        return JobTrace(job_id)
+
+    def backend_done(self, trace):
+        """Backend fertig: ohne GUI sofort abschließen, sonst an on_transcription_finished übergeben"""
+        # Mit GUI auch None einreihen - genau ein Eintrag pro finished-Signal
+        if self.ui_attached: self._ui_pending.append(trace)
+        else: self.finish(trace)
+
+    def take_ui(self):
+        """Trace zum gerade angekommenen finished-Signal (gleiche Reihenfolge wie die Queue)"""
+        return self._ui_pending.popleft() if self._ui_pending else None
+
+    def finish(self, trace):
+        if trace is None: return
+        record = trace.to_dict()
+        self.history.append(record)
+        path = self.config.get("trace_file")
+        if path:
+            with self._lock, open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        if self.on_record: self.on_record(record)
+
+    def percentiles(self):
+        """p50/p95 pro Stufe über den Verlauf"""
+        per_stage = {}
+        for record in list(self.history):
+            for stage, seconds in record["spans"].items():
+                per_stage.setdefault(stage, []).append(seconds)
+            per_stage.setdefault("total", []).append(record["total_s"])
+        result = {}
+        for stage, values in per_stage.items():
+            values.sort()
+            pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+            result[stage] = {"n": len(values), "p50": pick(0.5), "p95": pick(0.95)}
+        return result
@@ -0,0 +1,113 @@
+# Energie-basierte Sprach-Erkennung (VAD) für SnapScribe
+# Entfernt Stille vor der Inferenz, damit Whisper weniger 30-Sekunden-Fenster rechnen muss
+
+import numpy as np
+
+def frame_rms(audio, samplerate=16000, frame_s=0.03):
+    """RMS pro Frame, komplett vektorisiert (Rest am Ende fällt weg)"""
+    frame = max(1, int(samplerate * frame_s))
+    n = len(audio) // frame
+    if n == 0: return np.zeros(0, dtype=np.float32)
+    frames = audio[:n * frame].reshape(n, frame)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+
+MIN_THRESHOLD = 0.005  # Darunter ist ein Frame immer Stille (ca. -46 dBFS)
+
+def speech_threshold(rms, min_threshold=MIN_THRESHOLD, factor=3.0, cap=0.5):
+    """
+    Adaptive Schwelle: Vielfaches des Grundrauschens (10. Perzentil), mindestens min_threshold.
+    Das Grundrauschen zählt nur, wenn die lauten Frames (90. Perzentil) klar darüber liegen - sonst gibt es
+    keine echte Pause (Diktat ohne Absetzen, lauter Raum) und alles über min_threshold ist Sprache.
+    Höchstens cap * laute Frames, damit die Schwelle nie über der Sprache selbst landet.
+    """
+    if len(rms) == 0: return min_threshold
+    floor, loud = (float(p) for p in np.percentile(rms, [10, 90]))
+    if loud < floor * factor: return min_threshold
+    return max(min_threshold, min(floor * factor, loud * cap))
+
+class VadResult:
+    """Getrimmtes Audio plus Zuordnung zurück auf die Original-Zeitachse"""
+    def __init__(self, audio, segments, original_len, samplerate):
+        self.audio = audio
+        self.segments = segments  # Liste von (start_getrimmt, start_original, länge) in Samples
+        self.samplerate = samplerate
+        self.original_seconds = original_len / samplerate
+        self.removed_seconds = (original_len - len(audio)) / samplerate
+
+    def to_original(self, t):
+        """Rechnet eine Zeit (Sekunden) im getrimmten Audio auf das Original zurück"""
+        pos = int(t * self.samplerate)
+        for trim_start, orig_start, length in self.segments:
+            if pos < trim_start + length:
+                return (orig_start + max(0, pos - trim_start)) / self.samplerate
+        if not self.segments: return t
+        trim_start, orig_start, length = self.segments[-1]
+        return (orig_start + length) / self.samplerate
+
+def trim_silence(audio, samplerate=16000, frame_s=0.03, threshold=None, pad_s=0.2, keep_pause_s=0.3,
+                  min_speech_s=0.1):
+    """
+    Schneidet Stille am Anfang/Ende weg und kürzt Pausen auf keep_pause_s.
+    Um jede Sprachstelle bleiben pad_s Sekunden stehen, damit Wortanfänge nicht verloren gehen.
+    Weniger als min_speech_s Sprache in hörbarem Audio gilt als Fehlerkennung - dann bleibt alles stehen.
+    """
+    frame = max(1, int(samplerate * frame_s))
+    rms = frame_rms(audio, samplerate, frame_s)
+    if threshold is None: threshold = speech_threshold(rms)
+    speech = rms > threshold
+    if speech.sum() * frame_s < min_speech_s:
+        # Nur echte Stille verwerfen; bleibt von hörbarem Audio (fast) nichts übrig, lieber ungekürzt lassen
+        if not len(rms) or rms.max() < MIN_THRESHOLD:
+            return VadResult(audio[:0], [], len(audio), samplerate)
+        return VadResult(audio, [(0, 0, len(audio))], len(audio), samplerate)
+
+    # Sprach-Frames um pad Frames erweitern (Dilatation per Faltung)
+    pad = int(round(pad_s / frame_s))
+    if pad: speech = np.convolve(speech, np.ones(2 * pad + 1), mode="same") > 0
+
+    # Start/Ende der zusammenhängenden Sprachbereiche
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1) * frame
+    ends = np.minimum(np.flatnonzero(edges == -1) * frame, len(audio))
+    # Der unvollständige letzte Frame gehört zum letzten Bereich, wenn dieser bis zum Ende reicht
+    if speech[-1]: ends[-1] = len(audio)
+
+    keep = int(keep_pause_s * samplerate)
+    spans = []
+    for i, (s, e) in enumerate(zip(starts, ends)):
+        spans.append((s, e))
+        if i + 1 < len(starts) and keep:
+            # Kurze Pause behalten, damit Whisper Satzgrenzen noch erkennt
+            spans.append((e, min(starts[i + 1], e + keep)))
+
+    segments, pos = [], 0
+    for s, e in spans:
+        if e <= s: continue
+        if segments and segments[-1][1] + segments[-1][2] == s:
+            # Nahtlos anschließende Bereiche zusammenfassen
+            t, o, n = segments[-1]
+            segments[-1] = (t, o, n + int(e - s))
+        else:
+            segments.append((pos, int(s), int(e - s)))
+        pos += int(e - s)
+    trimmed = np.concatenate([audio[o:o + n] for _, o, n in segments])
+    return VadResult(trimmed, segments, len(audio), samplerate)
+
+class Endpointer:
+    """Erkennt das Ende einer Äußerung: erst Sprache, danach mindestens hangover_s Stille am Stück"""
+    def __init__(self, threshold=0.01, hangover_s=1.5, min_speech_s=0.3):
+        self.threshold = threshold
+        self.hangover_s = hangover_s
+        self.min_speech_s = min_speech_s
+        self.speech_s = 0.0
+        self.silence_s = 0.0
+
+    def feed(self, rms, duration):
+        """Pegel eines Blocks einspeisen, liefert True sobald das Ende erkannt wurde"""
+        if rms > self.threshold:
+            self.speech_s += duration
+            self.silence_s = 0.0
+        else:
+            self.silence_s += duration
+        # Vor der ersten Sprache nie abbrechen, sonst stoppt schon das Luftholen die Aufnahme
+        return self.speech_s >= self.min_speech_s and self.silence_s >= self.hangover_s
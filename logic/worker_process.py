@@ -0,0 +1,114 @@
+# Inferenz in einem langlebigen Worker-Prozess
+# Das Modell bleibt im Worker geladen, Audio kommt per Shared Memory (kein Pickling).
+# Abbrechen beendet den Prozess hart und startet sofort einen neuen, der das Modell vorlädt.
+
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from logic.engines import BaseEngine, ENGINES
+
+class TranscriptionCancelled(Exception):
+    pass
+
+def _worker_main(conn, engine_name, size, compute_type, cpu_threads):
+    """Läuft im Worker: Modell einmal laden, dann Jobs aus der Pipe abarbeiten"""
+    try:
+        engine = ENGINES[engine_name](size, compute_type, cpu_threads)
+        engine.load()
+    except Exception as e:
+        conn.send(("error", f"Modell konnte nicht geladen werden: {e}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        msg = conn.recv()
+        if msg is None: break
+        shm_name, length, language, prompt = msg
+        shm = shared_memory.SharedMemory(name=shm_name)
+        audio = np.ndarray((length,), dtype=np.float32, buffer=shm.buf)
+        try:
+            conn.send(("ok", engine.transcribe(audio, language=language, initial_prompt=prompt)))
+        except Exception as e:
+            conn.send(("error", str(e)))
+        finally:
+            # View vor close() freigeben, sonst bleibt der Puffer exportiert
+            del audio
+            shm.close()
+
+class ProcessEngine(BaseEngine):
+    """Engine-Wrapper: führt eine normale Engine in einem eigenen Prozess aus"""
+    def __init__(self, inner_name, size, compute_type="int8", cpu_threads=0):
+        super().__init__(size, compute_type, cpu_threads)
+        self.inner_name = inner_name
+        self.name = f"{inner_name}+process"
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.Lock()
+        self.process = None
+        self.conn = None
+
+    def _spawn(self):
+        parent, child = self._ctx.Pipe()
+        self.process = self._ctx.Process(target=_worker_main, daemon=True,
+                                         args=(child, self.inner_name, self.size, self.compute_type, self.cpu_threads))
+        self.process.start()
+        self.conn = parent
+
+    def _recv(self, conn, process):
+        """Wartet auf die nächste Antwort - bricht ab, sobald der Prozess gekillt wurde"""
+        while not conn.poll(0.1):
+            if not process.is_alive():
+                raise TranscriptionCancelled()
+        try:
+            return conn.recv()
+        except (EOFError, OSError):
+            raise TranscriptionCancelled()
+
+    def load(self):
+        self._spawn()
+        status, payload = self._recv(self.conn, self.process)
+        if status != "ready": raise RuntimeError(payload)
+        self.model = self.process
+
+    def transcribe(self, audio, language=None, initial_prompt=None):
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+        try:
+            with self._lock:
+                # Lokale Referenzen: cancel() ersetzt Prozess und Pipe, während wir hier noch warten
+                conn, process = self.conn, self.process
+                conn.send((shm.name, len(audio), language, initial_prompt))
+                status, payload = self._recv(conn, process)
+                # Ein frisch gestarteter Worker meldet sich zuerst mit "ready"
+                while status == "ready":
+                    status, payload = self._recv(conn, process)
+        finally:
+            shm.close()
+            shm.unlink()
+        if status != "ok": raise RuntimeError(payload)
+        return payload
+
+    def cancel(self):
+        """Laufenden Job sofort beenden: Prozess killen und direkt neu starten (Modell lädt im Hintergrund)"""
+        if self.process is None: return
+        # Erst den Nachfolger starten und eintragen, dann den alten killen -
+        # so findet der nächste Job sofort eine gültige Pipe vor
+        old = self.process
+        self._spawn()
+        self.model = self.process
+        old.kill()
+        old.join()
+
+    def unload(self):
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout=2)
+            if self.process.is_alive(): self.process.kill()
+        self.process = None
+        self.model = None
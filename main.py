@@ -1,42 +1,63 @@
+from logic.startup import StartupReport # Als erstes: setzt den Startzeitpunkt
 import sys
 import threading
-from PyQt6.QtWidgets import QApplication
+import multiprocessing
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from ui.splash import SplashScreen
-from ui.main_window import MainWindow
-from logic.backend import ConfigManager, AudioTranscriber
-from logic.hotkeys import GlobalHotkeyManager
-
 class Launcher(QObject):
     finished = pyqtSignal()
     progress = pyqtSignal(str, int)
 
-    def __init__(self, splash, transcriber):
+    def __init__(self, transcriber, report):
         super().__init__()
-        self.splash = splash
         self.transcriber = transcriber
-        self.progress.connect(self.splash.update_progress)
+        self.report = report
 
     def run(self):
-        self.transcriber.load_model(progress_callback=self.progress)
+        # Erst die Module für Aufnahme und Zwischenablage, dann Engine und Modell
+        self.report.preload(self.transcriber.config)
+        # Dauerbereitschaft: Mikrofon öffnen, sobald sounddevice geladen ist
+        self.transcriber.arm()
+        # Über das Loader-Future, damit eine frühe Aufnahme auf dasselbe Laden wartet
+        future = self.transcriber.load_model_async(progress_callback=self.progress)
+        if future: future.result()
+        self.report.mark("model_ready")
         self.finished.emit()
 
 def main():
+    report = StartupReport()
+    # GUI-Module erst hier importieren: Worker-Prozesse (spawn) laden main.py neu und
+    # brauchen weder Fenster noch die Windows-Hotkeys
+    for name in ("PyQt6.QtWidgets", "logic.backend", "ui.main_window", "logic.hotkeys"):
+        report.timed_import(name)
+    from PyQt6.QtWidgets import QApplication
+    from ui.splash import SplashScreen
+    from ui.main_window import MainWindow
+    from logic.backend import ConfigManager, AudioTranscriber
+    from logic.hotkeys import GlobalHotkeyManager
+    report.mark("imports")
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    report.mark("qapp")
 
-    config = ConfigManager()
+    # Speichern gebündelt im Hintergrund, der GUI-Thread schreibt nie selbst
+    config = ConfigManager(flush_delay=0.5)
     transcriber = AudioTranscriber(config)
 
     hk_manager = GlobalHotkeyManager(config)
     hk_manager.start()
+    report.mark("hotkeys")
 
-    splash = SplashScreen()
-    splash.show()
+    # Schnellstart: kein Splash, nur Tray - Hotkeys gehen sofort, das Modell lädt im Hintergrund
+    tray_start = config.get("tray_start")
+    if not tray_start:
+        splash = SplashScreen()
+        splash.show()
     
     # WICHTIG: Hier übergeben wir jetzt hk_manager!
     main_window = MainWindow(config, transcriber, hk_manager)
+    report.mark("tray")
 
     hk_manager.trigger_record.connect(main_window.toggle_record)
     
@@ -50,9 +71,13 @@ def main():
             
     hk_manager.trigger_show.connect(toggle_window_visibility)
 
-    launcher = Launcher(splash, transcriber)
+    launcher = Launcher(transcriber, report)
+    launcher.progress.connect(main_window.handle_progress if tray_start else splash.update_progress)
     
     def on_loaded():
+        if "--startup-report" in sys.argv or config.get("startup_report"):
+            report.write("startup_report.json", int(config.get("startup_budget_ms") or 0))
+        if tray_start: return
         splash.close()
         if config.get("minimize_to_tray"):
              # Optional: Nur Tray, oder einmal zeigen beim Start.
@@ -66,7 +91,15 @@ def main():
     t = threading.Thread(target=launcher.run, daemon=True)
     t.start()
 
-    sys.exit(app.exec())
+    code = app.exec()
+    config.flush()
+    sys.exit(code)
 
 if __name__ == "__main__":
+    # Nötig für den Inferenz-Worker-Prozess im PyInstaller-Build
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        # Headless: python main.py batch <dateien/ordner> ...
+        from logic.batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
     main()
\ No newline at end of file
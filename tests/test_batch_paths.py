@@ -0,0 +1,18 @@
+# --format txt: gleichnamige Eingaben dürfen nicht auf dieselbe Ausgabedatei fallen
+
+import os
+
+from logic.batch import _txt_path, _txt_root
+
+def test_same_stem_in_different_folders_and_formats(tmp_path):
+    files = [str(tmp_path / "in" / "a" / "memo.wav"), str(tmp_path / "in" / "a" / "memo.flac"),
+             str(tmp_path / "in" / "b" / "memo.wav")]
+    out = str(tmp_path / "out")
+    root = _txt_root(files)
+    paths = [_txt_path(out, f, root) for f in files]
+    assert len(set(paths)) == 3
+    assert paths[0] == os.path.join(out, "a", "memo.wav.txt")
+
+def test_single_file_lands_directly_in_output(tmp_path):
+    f = str(tmp_path / "memo.wav")
+    assert _txt_path("out", f, _txt_root([f])) == os.path.join("out", "memo.wav.txt")
@@ -0,0 +1,25 @@
+# Ergebnis-Cache: Plattenfehler dürfen den Job nicht kosten, Verdrängung ohne Verzeichnis-Scan pro put
+
+import os
+
+from logic.result_cache import ResultCache
+
+def test_unwritable_directory_is_ignored(tmp_path):
+    blocker = tmp_path / "cache"
+    blocker.write_text("kein Ordner")
+    cache = ResultCache(str(blocker / "sub"))
+    cache.put("k", "text")  # Not a directory - darf nicht durchschlagen
+    assert cache.get("k") is None
+
+def test_evicts_oldest_and_scans_only_when_over_budget(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path), max_mb=10500 / (1024 * 1024))
+    scans = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda d: scans.append(d) or listdir(d))
+    for i in range(30):
+        cache.put(f"k{i}", "x" * 1000)
+        os.utime(tmp_path / f"k{i}.txt", (i, i))  # Eindeutige LRU-Reihenfolge
+    assert len(scans) <= 12  # Einmal am Anfang, danach nur jedes zweite put
+    names = sorted(os.listdir(tmp_path))
+    assert "k29.txt" in names and "k0.txt" not in names
+    assert sum(os.path.getsize(tmp_path / n) for n in names) <= 10500
@@ -0,0 +1,45 @@
+# Absturz während einer ausgelagerten Aufnahme: die Datei muss danach über den Batch-Weg lesbar sein
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_WRITER = textwrap.dedent("""
+    import sys, time
+    import numpy as np
+    sys.path.insert(0, {root!r})
+    from logic.spill_buffer import SpillingBuffer
+    buf = SpillingBuffer({path!r}, 16000, window_seconds=10, fmt={fmt!r})
+    block = np.arange(1600, dtype=np.int16).reshape(-1, 1)
+    for _ in range(50):             # 5 s Audio in Blöcken zu 100 ms
+        buf.write(block)
+        time.sleep(0.01)
+    print("written", flush=True)
+    time.sleep(60)                  # Wird vorher hart beendet - close() läuft nie
+""")
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGKILL")
+def test_wav_recording_survives_killed_writer(tmp_path):
+    from logic.batch import read_audio
+
+    path = str(tmp_path / "rec.wav")
+    proc = subprocess.Popen([sys.executable, "-c", _WRITER.format(root=ROOT, path=path, fmt="wav")],
+                            stdout=subprocess.PIPE, text=True)
+    try:
+        assert proc.stdout.readline().strip() == "written"
+        time.sleep(0.6)  # Writer-Thread flusht alle 200 ms
+        os.kill(proc.pid, signal.SIGKILL)
+    finally:
+        proc.wait()
+
+    audio = read_audio(path).read()
+    assert len(audio) == 80000
+    assert np.array_equal(np.round(audio * 32768), np.tile(np.arange(1600), 50))
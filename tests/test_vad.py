@@ -0,0 +1,37 @@
+# VAD darf durchgehende Sprache nicht als Stille verwerfen
+
+import numpy as np
+
+from logic.vad import trim_silence
+
+SR = 16000
+
+def _tone(seconds, amplitude=0.1, freq=220):
+    t = np.arange(int(seconds * SR)) / SR
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+def test_flat_tone_is_kept():
+    audio = _tone(4)
+    assert len(trim_silence(audio, SR).audio) == len(audio)
+
+def test_pause_free_modulated_noise_is_kept():
+    rng = np.random.default_rng(0)
+    t = np.arange(4 * SR) / SR
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 3 * t)  # Silbenrhythmus, aber nie leise
+    audio = (0.1 * envelope * rng.standard_normal(len(t))).astype(np.float32)
+    assert len(trim_silence(audio, SR).audio) >= 0.9 * len(audio)
+
+def test_noisy_room_with_low_snr_is_kept():
+    rng = np.random.default_rng(1)
+    noise = 0.05 * rng.standard_normal(4 * SR)
+    audio = (noise + _tone(4, amplitude=0.08)).astype(np.float32)
+    assert len(trim_silence(audio, SR).audio) >= 0.9 * len(audio)
+
+def test_pauses_are_still_trimmed():
+    silence = np.zeros(2 * SR, dtype=np.float32)
+    audio = np.concatenate((silence, _tone(1), silence, _tone(1), silence))
+    result = trim_silence(audio, SR)
+    assert 2 * SR <= len(result.audio) < 3.5 * SR
+
+def test_digital_silence_is_dropped():
+    assert len(trim_silence(np.zeros(4 * SR, dtype=np.float32), SR).audio) == 0
@@ -0,0 +1,101 @@
+import threading
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, QTableWidget, QTableWidgetItem,
+                             QHeaderView)
+from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon
+
+from ui import i18n as _i18n
+from logic.backend import get_asset_path
+from logic.diagnostics import snapshot
+
+class DiagnosticsWindow(QWidget):
+    """Zeigt RAM, geladene Modelle, Aufnahmepuffer und die letzten Jobs; aktualisiert sich per Timer"""
+    snapshot_ready = pyqtSignal(object)
+
+    def __init__(self, config, transcriber):
+        super().__init__()
+        self.config = config
+        self.transcriber = transcriber
+        self.lang = config.get("language") or "en"
+        self._busy = False
+        self.setWindowTitle(_i18n.t("diagnostics", self.lang))
+        icon_path = get_asset_path("icon.ico")
+        if icon_path: self.setWindowIcon(QIcon(icon_path))
+        self.resize(520, 420)
+        self.init_ui()
+
+        self.snapshot_ready.connect(self.apply_snapshot)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+        form = QFormLayout()
+        self.lbl_rss = QLabel("-")
+        form.addRow(_i18n.t("diag_rss", self.lang), self.lbl_rss)
+        self.lbl_models = QLabel("-")
+        self.lbl_models.setWordWrap(True)
+        form.addRow(_i18n.t("diag_models", self.lang), self.lbl_models)
+        self.lbl_long_pool = QLabel("-")
+        form.addRow(_i18n.t("diag_long_pool", self.lang), self.lbl_long_pool)
+        self.lbl_buffer = QLabel("-")
+        form.addRow(_i18n.t("diag_buffer", self.lang), self.lbl_buffer)
+        self.lbl_queue = QLabel("-")
+        form.addRow(_i18n.t("diag_queue", self.lang), self.lbl_queue)
+        self.lbl_extra = QLabel("-")
+        form.addRow(_i18n.t("diag_savings", self.lang), self.lbl_extra)
+        layout.addLayout(form)
+
+        self.lbl_jobs = QLabel(_i18n.t("diag_jobs", self.lang))
+        layout.addWidget(self.lbl_jobs)
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Job", "Audio (s)", "RTF", _i18n.t("diag_latency", self.lang)])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().hide()
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        # Werte im Hintergrund sammeln, die GUI wartet nie darauf
+        if self._busy: return
+        self._busy = True
+        threading.Thread(target=self._collect, daemon=True).start()
+
+    def _collect(self):
+        try:
+            self.snapshot_ready.emit(snapshot(self.transcriber))
+        finally:
+            self._busy = False
+
+    def apply_snapshot(self, snap):
+        rss = snap["rss_mb"]
+        self.lbl_rss.setText(f"{rss:.0f} MB" if rss is not None else "?")
+
+        models = [f"{m['key']} (~{m['mb']} MB)" + (" *" if m["key"] == snap["active_model"] else "")
+                  for m in snap["models"]]
+        used = sum(m["mb"] for m in snap["models"])
+        self.lbl_models.setText(("\n".join(models) or "-") + f"\n{used} / {snap['models_budget_mb']} MB Budget")
+        pool = snap["long_pool"]
+        self.lbl_long_pool.setText(f"{pool['workers']} × {pool['key']} (~{pool['mb']} MB)" if pool else "-")
+
+        self.lbl_buffer.setText(f"{snap['buffer_s']:.1f} s / {snap['buffer_mb']:.1f} MB")
+        self.lbl_queue.setText(str(snap["queue"]))
+        cache = snap["cache"]
+        cache_txt = f", Cache {cache['hits']}/{cache['hits'] + cache['misses']}" if cache else ""
+        self.lbl_extra.setText(f"VAD {snap['vad_removed_s']:.0f} s{cache_txt}")
+
+        jobs = list(reversed(snap["jobs"]))
+        self.table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            values = [job["job"], job.get("audio_s", "-"), job.get("rtf", "-"), job.get("latency_s", "-")]
+            for col, val in enumerate(values):
+                self.table.setItem(row, col, QTableWidgetItem(str(val)))
@@ -24,7 +24,37 @@ _translations: Dict[str, Dict[str, str]] = {
         "minimize_tray": "Minimize to tray",
         "settings_saved": "Settings saved.",
         "cancelled": "Cancelled",
-        "placeholder_text": "Transcription appears here..."
+        "placeholder_text": "Transcription appears here...",
+        "streaming": "Live transcription while recording",
+        "engine_label": "Engine:",
+        "compute_type_label": "Compute type:",
+        "cpu_threads_label": "CPU threads:",
+        "auto": "Auto",
+        "vad_trim": "Remove silence before transcribing",
+        "auto_stop": "Stop recording automatically after silence",
+        "worker_process": "Transcribe in separate process (cancellable)",
+        "tray_start": "Fast start in tray (no splash screen)",
+        "always_armed": "Keep microphone open (no clipped first words)",
+        "spill_to_disk": "Stream recordings to disk (long meetings, crash-safe)",
+        "draft_model_label": "Quick draft model:",
+        "clipboard_policy_label": "Clipboard (two-pass):",
+        "clip_draft": "Draft only",
+        "clip_refined": "Refined text only",
+        "clip_both": "Draft, then refined",
+        "refining": "Draft - refining...",
+        "refined_kept_edit": "Refined text ready - your edits were kept",
+        "long_audio_workers_label": "Parallel workers (long recordings):",
+        "off": "Off",
+        "settings_corrupt": "settings.json was damaged - defaults loaded, old file kept as .corrupt",
+        "diagnostics": "Diagnostics",
+        "diag_rss": "Process memory:",
+        "diag_models": "Loaded models:",
+        "diag_long_pool": "Long-recording workers:",
+        "diag_buffer": "Recording buffer:",
+        "diag_queue": "Jobs in queue:",
+        "diag_savings": "Saved:",
+        "diag_jobs": "Recent jobs:",
+        "diag_latency": "Stop to text (s)"
     },
     "de": {
         "ready": "Bereit",
@@ -46,7 +76,37 @@ _translations: Dict[str, Dict[str, str]] = {
         "minimize_tray": "In Tray minimieren",
         "settings_saved": "Einstellungen gespeichert.",
         "cancelled": "Abgebrochen",
-        "placeholder_text": "Transkription erscheint hier..."
+        "placeholder_text": "Transkription erscheint hier...",
+        "streaming": "Live-Transkription während der Aufnahme",
+        "engine_label": "Engine:",
+        "compute_type_label": "Rechenformat:",
+        "cpu_threads_label": "CPU-Threads:",
+        "auto": "Automatisch",
+        "vad_trim": "Stille vor der Transkription entfernen",
+        "auto_stop": "Aufnahme bei Stille automatisch beenden",
+        "worker_process": "In eigenem Prozess transkribieren (abbrechbar)",
+        "tray_start": "Schnellstart im Tray (ohne Startbildschirm)",
+        "always_armed": "Mikrofon offen halten (kein abgeschnittener Wortanfang)",
+        "spill_to_disk": "Aufnahme auf die Platte schreiben (lange Meetings, absturzsicher)",
+        "draft_model_label": "Schneller Entwurf mit:",
+        "clipboard_policy_label": "Zwischenablage (zwei Durchgänge):",
+        "clip_draft": "Nur Entwurf",
+        "clip_refined": "Nur verfeinerter Text",
+        "clip_both": "Entwurf, dann verfeinert",
+        "refining": "Entwurf - wird verfeinert...",
+        "refined_kept_edit": "Verfeinerter Text fertig - deine Änderungen bleiben erhalten",
+        "long_audio_workers_label": "Parallele Worker (lange Aufnahmen):",
+        "off": "Aus",
+        "settings_corrupt": "settings.json war beschädigt - Standardwerte geladen, alte Datei als .corrupt gesichert",
+        "diagnostics": "Diagnose",
+        "diag_rss": "Prozess-Speicher:",
+        "diag_models": "Geladene Modelle:",
+        "diag_long_pool": "Worker für lange Aufnahmen:",
+        "diag_buffer": "Aufnahmepuffer:",
+        "diag_queue": "Jobs in Warteschlange:",
+        "diag_savings": "Eingespart:",
+        "diag_jobs": "Letzte Jobs:",
+        "diag_latency": "Stop bis Text (s)"
     }
 }
 
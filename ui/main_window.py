@@ -1,5 +1,3 @@
-import threading
-import pyperclip
 from PyQt6.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QPushButton, 
                              QTextEdit, QLabel, QHBoxLayout, QSystemTrayIcon, QMenu, QApplication, QMessageBox,
                              QStackedWidget, QProgressBar, QFrame)
@@ -8,8 +6,10 @@ from PyQt6.QtGui import QIcon, QAction, QCursor, QColor
 
 from ui.settings_dialog import SettingsDialog
 from ui.visualizer import RecordingOverlay
+from ui.diagnostics import DiagnosticsWindow
 from ui import i18n as _i18n
-from logic.backend import get_asset_path
+from logic.backend import get_asset_path, MODEL_KEYS
+from logic.tracing import span
 
 class MainWindow(QMainWindow):
     def __init__(self, config, transcriber, hk_manager):
@@ -19,19 +19,33 @@ class MainWindow(QMainWindow):
         self.hk_manager = hk_manager
         
         self.shown_tray_message = False
+        self.diagnostics = None
+        self.draft_text = None       # Angezeigter Entwurf, bis der verfeinerte Text kommt
+        # Pegel im Bildtakt abholen statt pro Audioblock ein Signal zu verarbeiten
+        self.level_timer = QTimer(self)
+        self.level_timer.setInterval(33)
+        self.level_timer.timeout.connect(self.update_visualizer)
         
         self.transcriber.signals.finished.connect(self.on_transcription_finished)
         self.transcriber.signals.status.connect(self.update_status)
         self.transcriber.signals.progress.connect(self.handle_progress)
-        self.transcriber.signals.amplitude.connect(self.update_visualizer)
+        self.transcriber.signals.partial.connect(self.on_partial_text)
+        self.transcriber.signals.draft.connect(self.on_draft_text)
+        self.transcriber.signals.auto_stopped.connect(self.on_auto_stopped)
         
         self.hk_manager.registration_failed.connect(self.on_hotkey_error)
+        # UI-Stufen (Zwischenablage, Fenster) gehören mit in den Trace eines Jobs
+        self.transcriber.tracer.ui_attached = True
 
         self.init_ui()
         self.init_tray()
         
         # Sprache initial anwenden
         self.apply_language()
+        if self.config.load_error:
+            # Statuszeile wird vom Modell-Laden überschrieben, daher als Tray-Meldung
+            self.tray.showMessage("SnapScribe", _i18n.t("settings_corrupt", self.config.get("language") or "en"),
+                                  QSystemTrayIcon.MessageIcon.Warning)
 
     def init_ui(self):
         self.setWindowTitle("SnapScribe")
@@ -72,7 +86,7 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.text_area)
         
         # Seite 2: Recording Overlay
-        self.rec_overlay = RecordingOverlay()
+        self.rec_overlay = RecordingOverlay(self.config.get("visualizer_bars") or 50)
         self.stack.addWidget(self.rec_overlay)
         
         self.layout.addWidget(self.stack)
@@ -157,6 +171,7 @@ class MainWindow(QMainWindow):
             
             self.stack.setCurrentWidget(self.rec_overlay)
             self.rec_overlay.start()
+            self.level_timer.start()
             
             self.btn_cancel.show()
             self.rec_indicator.show()
@@ -172,6 +187,12 @@ class MainWindow(QMainWindow):
             self.rec_overlay.stop()
             self.reset_ui_state_to_loading()
 
+    def on_auto_stopped(self):
+        """Endpointing hat gestoppt - gleiche Ansicht wie beim manuellen Bestätigen"""
+        if self.stack.currentWidget() == self.rec_overlay:
+            self.rec_overlay.stop()
+            self.reset_ui_state_to_loading()
+
     def cancel_process(self):
         """Bricht alles ab"""
         # 1. Backend stoppen
@@ -179,7 +200,8 @@ class MainWindow(QMainWindow):
         
         # 2. GUI Elemente HART stoppen
         self.rec_overlay.stop() # Timer aus, Daten löschen
-        self.loading_bar.hide()
+        # Ältere Jobs in der Warteschlange laufen weiter
+        self.loading_bar.setVisible(self.transcriber.transcribing)
         
         # 3. Ansicht erzwingen
         self.stack.setCurrentWidget(self.text_area)
@@ -191,7 +213,9 @@ class MainWindow(QMainWindow):
         self.adjust_text_height()
 
     def reset_ui_state_to_loading(self):
-        self.action_container.hide()
+        # Mic bleibt aktiv: das nächste Diktat darf schon starten, während dieses noch transkribiert wird
+        self.action_container.show()
+        self.action_container.setCurrentWidget(self.btn_mic)
         self.rec_indicator.hide()
         self.btn_cancel.show()
         
@@ -200,7 +224,8 @@ class MainWindow(QMainWindow):
         self.lbl_status.setText(_i18n.t("waiting_transcription", lang))
 
     def reset_buttons_default(self):
-        self.btn_cancel.hide()
+        # Solange noch Jobs offen sind, bleibt ✕ zum Abbrechen da
+        self.btn_cancel.setVisible(self.transcriber.transcribing)
         self.rec_indicator.hide()
         self.action_container.show()
         self.action_container.setCurrentWidget(self.btn_mic)
@@ -208,32 +233,84 @@ class MainWindow(QMainWindow):
     def handle_progress(self, text, val):
         if val == -1: 
             self.loading_bar.show()
-            self.lbl_status.setText(text)
+            if not self.transcriber.recording: self.lbl_status.setText(text)
         else:
             self.lbl_status.setText(f"{text} ({val}%)")
 
-    def update_visualizer(self, amp):
+    def update_visualizer(self):
         # WICHTIG: Nur updaten, wenn wir wirklich im Aufnahme-Screen sind!
-        # Das verhindert den "Mix-State", falls ein spätes Signal reinfliegt.
-        if self.transcriber.recording and self.stack.currentWidget() == self.rec_overlay:
-            self.rec_overlay.update_amplitude(amp)
+        # Das verhindert den "Mix-State" nach Stopp oder Abbruch.
+        if not (self.transcriber.recording and self.stack.currentWidget() == self.rec_overlay):
+            self.level_timer.stop()
+            return
+        level = self.transcriber.levels.pull()
+        if level is not None:
+            self.rec_overlay.update_amplitude(level[0])
+
+    def on_partial_text(self, text):
+        # Zwischenstand landet schon im Textfeld, sichtbar spätestens nach dem Stoppen
+        self.text_area.setPlainText(text)
+
+    def on_draft_text(self, text):
+        """Zwei-Pass-Modus: Entwurf sofort zeigen, das große Modell rechnet im Hintergrund weiter"""
+        lang = self.config.get("language") or "en"
+        self.draft_text = text
+        self.text_area.setPlainText(text)
+        if text and self.config.get("auto_copy") and self.config.get("clipboard_policy") in ("draft", "both"):
+            import pyperclip
+            pyperclip.copy(text)
+        if self.transcriber.recording: return
+        self.reset_buttons_default()
+        self.lbl_status.setText(_i18n.t("refining", lang))
+        self.adjust_text_height()
+        self.showNormal()
+        self.activateWindow()
+        self.raise_()
+
+    def _copy_final(self, draft):
+        """Zwischenablage nach clipboard_policy; ohne Entwurf wie bisher immer"""
+        if draft is None: return True
+        policy = self.config.get("clipboard_policy")
+        if policy == "refined": return True
+        if policy != "both": return False
+        # Nur ersetzen, solange dort noch unser Entwurf steht
+        import pyperclip
+        return pyperclip.paste() == draft
 
     def on_transcription_finished(self, text):
+        trace = self.transcriber.tracer.take_ui()
         self.loading_bar.hide()
-        self.reset_buttons_default()
         lang = self.config.get("language") or "en"
-        
-        if text: 
+        draft, self.draft_text = self.draft_text, None
+        # Hat der Nutzer den Entwurf bearbeitet, bleibt seine Fassung stehen
+        edited = draft is not None and self.text_area.toPlainText() != draft
+
+        if text and not edited:
+            with span(trace, "ui_text"):
+                self.text_area.setPlainText(text)
+            if self.config.get("auto_copy"):
+                with span(trace, "clipboard"):
+                    import pyperclip # Erst hier - wird beim Start im Hintergrund vorgeladen
+                    if self._copy_final(draft): pyperclip.copy(text)
+        # Läuft schon das nächste Diktat, bleibt die Aufnahme-Ansicht unangetastet
+        if self.transcriber.recording: return self.transcriber.tracer.finish(trace)
+
+        self.reset_buttons_default()
+        if edited:
+            self.lbl_status.setText(_i18n.t("refined_kept_edit", lang))
+        elif text: 
             self.lbl_status.setText(_i18n.t("finished", lang))
-            self.text_area.setPlainText(text)
-            if self.config.get("auto_copy"): pyperclip.copy(text)
         else:
             self.lbl_status.setText(_i18n.t("ready", lang))
+        # Der Entwurf hat das Fenster schon geholt - nicht erneut den Fokus stehlen
+        if draft is not None: return self.transcriber.tracer.finish(trace)
             
-        self.adjust_text_height()
-        self.showNormal()
-        self.activateWindow()
-        self.raise_()
+        with span(trace, "window_raise"):
+            self.adjust_text_height()
+            self.showNormal()
+            self.activateWindow()
+            self.raise_()
+        self.transcriber.tracer.finish(trace)
 
     # --- Rest bleibt gleich ---
     
@@ -255,6 +332,7 @@ class MainWindow(QMainWindow):
             event.accept()
 
     def update_status(self, msg):
+        if self.transcriber.recording: return
         self.lbl_status.setText(msg)
 
     def adjust_text_height(self):
@@ -269,18 +347,25 @@ class MainWindow(QMainWindow):
         self.settings_dlg.settings_saved.connect(self.on_settings_changed)
         self.settings_dlg.exec()
 
-    def on_settings_changed(self):
+    def open_diagnostics(self):
+        if self.diagnostics is None:
+            self.diagnostics = DiagnosticsWindow(self.config, self.transcriber)
+        self.diagnostics.show()
+        self.diagnostics.raise_()
+
+    def on_settings_changed(self, changed):
         lang = self.config.get("language") or "en"
         self.update_status(_i18n.t("settings_saved", lang))
-        self.hk_manager.update_hotkeys()
+        if changed & {"hotkey_record", "hotkey_show"}:
+            self.hk_manager.update_hotkeys()
         # Sprache neu anwenden nach Speichern
-        self.apply_language()
-        threading.Thread(target=self._reload_model_thread, daemon=True).start()
-
-    def _reload_model_thread(self):
-        self.transcriber.model = None 
-        self.transcriber.load_model(progress_callback=self.transcriber.signals.progress)
-        self.transcriber.signals.status.emit("Bereit")
+        if "language" in changed:
+            self.apply_language()
+        if not changed & MODEL_KEYS: return
+        # Gleicher Modell-Schlüssel -> kein Neuladen, bekannte Modelle kommen aus der Registry.
+        # Eine Aufnahme direkt danach wartet in _transcribe auf dasselbe Future.
+        future = self.transcriber.load_model_async(progress_callback=self.transcriber.signals.progress)
+        if future: future.add_done_callback(lambda f: self.transcriber.signals.status.emit("Bereit"))
 
     def init_tray(self):
         self.tray = QSystemTrayIcon(self)
@@ -293,6 +378,7 @@ class MainWindow(QMainWindow):
         self.tray_menu.addSeparator()
         # Diese werden in apply_language aktualisiert
         self.tray_action_open = self.tray_menu.addAction("Open", self.showNormal)
+        self.tray_action_diag = self.tray_menu.addAction("Diagnostics", self.open_diagnostics)
         self.tray_action_exit = self.tray_menu.addAction("Exit", self.close_app)
         self.tray.activated.connect(self.on_tray_activated)
         self.tray.show()
@@ -323,7 +409,9 @@ class MainWindow(QMainWindow):
         if hasattr(self, "tray_action_open") and hasattr(self, "tray_action_exit"):
             self.tray_action_open.setText(_i18n.t("open", lang))
             self.tray_action_exit.setText(_i18n.t("exit", lang))
+            self.tray_action_diag.setText(_i18n.t("diagnostics", lang))
 
     def close_app(self):
         self.tray.hide()
+        self.config.flush()
         QApplication.instance().quit()
\ No newline at end of file
@@ -1,19 +1,20 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLineEdit, QHBoxLayout,
-                             QCheckBox, QComboBox, QPushButton, QFormLayout, QMessageBox)
+                             QCheckBox, QComboBox, QPushButton, QFormLayout, QMessageBox, QSpinBox)
 from PyQt6.QtCore import pyqtSignal, QTimer
 from logic.backend import ConfigManager
+from logic.engines import ENGINES
 from ui.widgets import HotkeyLineEdit
 from ui import i18n as _i18n
 
 class SettingsDialog(QDialog):
-    settings_saved = pyqtSignal()
+    settings_saved = pyqtSignal(object)  # Menge der geänderten Schlüssel
 
     def __init__(self, config: ConfigManager, parent=None):
         super().__init__(parent)
         self.config = config
         self.current_lang = config.get("language") or "en"
         self.setWindowTitle(_i18n.t("settings_title", self.current_lang))
-        self.resize(400, 380)
+        self.resize(400, 580)
         
         # Hier speichern wir die funktionierenden Werte vor dem Speichern
         self.backup_values = {}
@@ -29,6 +30,33 @@ class SettingsDialog(QDialog):
         self.combo_model.addItems(["base", "small", "medium", "large-v3"])
         form.addRow("Lokales Modell:", self.combo_model)
 
+        self.combo_engine = QComboBox()
+        self.combo_engine.addItems(list(ENGINES))
+        self.combo_engine.currentTextChanged.connect(self.on_engine_changed)
+        form.addRow(_i18n.t("engine_label", self.current_lang), self.combo_engine)
+
+        self.combo_compute = QComboBox()
+        form.addRow(_i18n.t("compute_type_label", self.current_lang), self.combo_compute)
+
+        self.spin_threads = QSpinBox()
+        self.spin_threads.setRange(0, 64)
+        self.spin_threads.setSpecialValueText(_i18n.t("auto", self.current_lang))
+        form.addRow(_i18n.t("cpu_threads_label", self.current_lang), self.spin_threads)
+
+        self.spin_long_workers = QSpinBox()
+        self.spin_long_workers.setRange(0, 16)
+        self.spin_long_workers.setSpecialValueText(_i18n.t("off", self.current_lang))
+        form.addRow(_i18n.t("long_audio_workers_label", self.current_lang), self.spin_long_workers)
+
+        self.combo_draft = QComboBox()
+        self.combo_draft.addItem(_i18n.t("off", self.current_lang), "")
+        for size in ("tiny", "base", "small"): self.combo_draft.addItem(size, size)
+        form.addRow(_i18n.t("draft_model_label", self.current_lang), self.combo_draft)
+
+        self.combo_clip = QComboBox()
+        for policy in ("both", "draft", "refined"): self.combo_clip.addItem(_i18n.t(f"clip_{policy}", self.current_lang), policy)
+        form.addRow(_i18n.t("clipboard_policy_label", self.current_lang), self.combo_clip)
+
         self.combo_mode = QComboBox()
         self.combo_mode.addItems(["local", "api"])
         form.addRow("Modus:", self.combo_mode)
@@ -59,6 +87,24 @@ class SettingsDialog(QDialog):
         self.cb_tray = QCheckBox(_i18n.t("minimize_tray", self.current_lang))
         self.layout.addWidget(self.cb_tray)
 
+        self.cb_streaming = QCheckBox(_i18n.t("streaming", self.current_lang))
+        self.layout.addWidget(self.cb_streaming)
+
+        self.cb_vad = QCheckBox(_i18n.t("vad_trim", self.current_lang))
+        self.layout.addWidget(self.cb_vad)
+
+        self.cb_auto_stop = QCheckBox(_i18n.t("auto_stop", self.current_lang))
+        self.layout.addWidget(self.cb_auto_stop)
+
+        self.cb_worker = QCheckBox(_i18n.t("worker_process", self.current_lang))
+        self.layout.addWidget(self.cb_worker)
+        self.cb_armed = QCheckBox(_i18n.t("always_armed", self.current_lang))
+        self.layout.addWidget(self.cb_armed)
+        self.cb_spill = QCheckBox(_i18n.t("spill_to_disk", self.current_lang))
+        self.layout.addWidget(self.cb_spill)
+        self.cb_tray_start = QCheckBox(_i18n.t("tray_start", self.current_lang))
+        self.layout.addWidget(self.cb_tray_start)
+
         btn_layout = QHBoxLayout()
         
         self.btn_save = QPushButton(_i18n.t("save", self.current_lang))
@@ -76,6 +122,11 @@ class SettingsDialog(QDialog):
     def load_ui_values(self):
         self.combo_model.setCurrentText(self.config.get("local_model_size"))
         self.combo_mode.setCurrentText(self.config.get("active_mode"))
+        self.combo_engine.setCurrentText(self.config.get("engine"))
+        self.on_engine_changed(self.combo_engine.currentText())
+        self.combo_compute.setCurrentText(self.config.get("compute_type"))
+        self.spin_threads.setValue(int(self.config.get("cpu_threads") or 0))
+        self.spin_long_workers.setValue(int(self.config.get("long_audio_workers") or 0))
         self.inp_api.setText(self.config.get("api_key"))
         
         self.inp_hk_rec.setText(self.config.get("hotkey_record"))
@@ -88,10 +139,26 @@ class SettingsDialog(QDialog):
         
         self.cb_copy.setChecked(self.config.get("auto_copy"))
         self.cb_tray.setChecked(self.config.get("minimize_to_tray"))
+        self.cb_streaming.setChecked(self.config.get("streaming"))
+        self.cb_vad.setChecked(self.config.get("vad_trim"))
+        self.cb_auto_stop.setChecked(self.config.get("auto_stop"))
+        self.cb_worker.setChecked(self.config.get("worker_process"))
+        self.cb_tray_start.setChecked(self.config.get("tray_start"))
+        self.cb_armed.setChecked(self.config.get("always_armed"))
+        self.cb_spill.setChecked(self.config.get("spill_to_disk"))
+        self.combo_draft.setCurrentIndex(max(0, self.combo_draft.findData(self.config.get("draft_model") or "")))
+        self.combo_clip.setCurrentIndex(max(0, self.combo_clip.findData(self.config.get("clipboard_policy"))))
         
         self.inp_hk_rec.setStyleSheet("background: #ffffff; border: 1px solid #ccc; padding: 5px;")
         self.inp_hk_show.setStyleSheet("background: #ffffff; border: 1px solid #ccc; padding: 5px;")
 
+    def on_engine_changed(self, name):
+        """Compute-Typen hängen von der Engine ab"""
+        current = self.combo_compute.currentText()
+        self.combo_compute.clear()
+        self.combo_compute.addItems(ENGINES[name].compute_types)
+        if current: self.combo_compute.setCurrentText(current)
+
     def on_hotkey_rec_detected(self, hk):
         self.inp_hk_rec.setText(hk)
         self.inp_hk_rec.setStyleSheet("background: #e8f5e9; border: 1px solid #4CAF50; padding: 5px;")
@@ -107,22 +174,37 @@ class SettingsDialog(QDialog):
         self.backup_values["hotkey_record"] = self.config.get("hotkey_record")
         self.backup_values["hotkey_show"] = self.config.get("hotkey_show")
         
-        # 2. Neue Werte speichern
-        self.config.set("local_model_size", self.combo_model.currentText())
-        self.config.set("active_mode", self.combo_mode.currentText())
-        self.config.set("api_key", self.inp_api.text())
-        self.config.set("hotkey_record", self.inp_hk_rec.text())
-        self.config.set("hotkey_show", self.inp_hk_show.text())
-        self.config.set("auto_copy", self.cb_copy.isChecked())
-        self.config.set("minimize_to_tray", self.cb_tray.isChecked())
-        
+        # 2. Neue Werte speichern - alles in einem Schreibvorgang
+        values = {
+            "local_model_size": self.combo_model.currentText(),
+            "active_mode": self.combo_mode.currentText(),
+            "engine": self.combo_engine.currentText(),
+            "compute_type": self.combo_compute.currentText(),
+            "cpu_threads": self.spin_threads.value(),
+            "long_audio_workers": self.spin_long_workers.value(),
+            "api_key": self.inp_api.text(),
+            "hotkey_record": self.inp_hk_rec.text(),
+            "hotkey_show": self.inp_hk_show.text(),
+            "auto_copy": self.cb_copy.isChecked(),
+            "minimize_to_tray": self.cb_tray.isChecked(),
+            "streaming": self.cb_streaming.isChecked(),
+            "vad_trim": self.cb_vad.isChecked(),
+            "auto_stop": self.cb_auto_stop.isChecked(),
+            "worker_process": self.cb_worker.isChecked(),
+            "tray_start": self.cb_tray_start.isChecked(),
+            "always_armed": self.cb_armed.isChecked(),
+            "spill_to_disk": self.cb_spill.isChecked(),
+            "draft_model": self.combo_draft.currentData(),
+            "clipboard_policy": self.combo_clip.currentData(),
+        }
         # Sprache speichern (Datenrolle)
         lang_code = self.combo_lang.currentData()
         if lang_code:
-            self.config.set("language", lang_code)
+            values["language"] = lang_code
+        changed = self.config.update(values)
         
         # 3. Signalisieren
-        self.settings_saved.emit()
+        self.settings_saved.emit(changed)
         
         # Feedback Button
         original_text = self.btn_save.text()
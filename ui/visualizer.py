@@ -1,54 +1,140 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt, QTimer, QRectF
-from PyQt6.QtGui import QPainter, QColor, QBrush
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPixmap
 
 class AudioVisualizer(QWidget):
-    """Zeichnet die Audio-Wellenform live"""
-    def __init__(self):
+    """Zeichnet die Audio-Wellenform live
+
+    Die Balken liegen in einem Ringpuffer und werden in eine Pixmap gerendert. Pro neuem Wert wird die
+    Pixmap nur um einen Balken verschoben und der neueste Balken gezeichnet. Ein Klick schaltet auf die
+    Übersicht der ganzen Aufnahme (auf die Breite heruntergerechnet) und zurück.
+    """
+    def __init__(self, bars=50):
         super().__init__()
         self.setFixedHeight(60)
-        self.amplitudes = [0.0] * 50
-        
+        self.bars = max(8, int(bars))
+        self.overview = False
+
         self.bar_color = QColor("#4CAF50")
         self.bg_color = QColor("#f0f0f0")
+        self._cache = None
+        self.clear()
 
-    def add_amplitude(self, val):
-        val = min(val, 100.0) / 5.0 
-        self.amplitudes.pop(0)
-        self.amplitudes.append(val)
+    def add_amplitude(self, rms):
+        # rms in [0, 1]; Sprache liegt typisch bei 0.01-0.1, daher stark verstärkt
+        val = min(rms * 80.0, 1.0)
+        if self._ring is None: self._allocate()
+        self._ring[self._head] = val
+        self._head = (self._head + 1) % self.bars
+        if self._count == len(self._history):
+            self._history = self.np.concatenate([self._history, self.np.zeros_like(self._history)])
+        self._history[self._count] = val
+        self._count += 1
+
+        if self.overview:
+            self._cache = None
+        elif self._cache is not None:
+            self._scroll_in(val)
         self.update()
 
     # NEU: Methode zum Zurücksetzen
     def clear(self):
-        self.amplitudes = [0.0] * 50
+        # Puffer erst beim ersten Wert anlegen - numpy bleibt so aus dem Programmstart heraus
+        self._ring = None
+        self._history = None
+        self._head = 0                   # Nächste Schreibposition = ältester Balken
+        self._count = 0
+        self._cache = None
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        w = self.width()
+    def _allocate(self):
+        import numpy
+        self.np = numpy
+        self._ring = numpy.zeros(self.bars, dtype=numpy.float32)
+        self._history = numpy.zeros(1024, dtype=numpy.float32)
+
+    def mousePressEvent(self, event):
+        self.overview = not self.overview
+        self._cache = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
+
+    def _bar_width(self):
+        # Ganzzahlig, damit das Verschieben der Pixmap nicht driftet; Rest bleibt links frei
+        return max(2, self.width() // self.bars)
+
+    def _new_pixmap(self):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.bg_color)
+        return pixmap
+
+    def _draw_bar(self, painter, x, amp):
         h = self.height()
-        
-        # Sicherheit: Division durch Null verhindern
-        if len(self.amplitudes) == 0: return
-        
-        bar_width = w / len(self.amplitudes)
-        
+        bar_h = max(2, amp * (h * 0.8))
+        gap = 1
+        painter.drawRoundedRect(QRectF(x + gap, (h - bar_h) / 2, self._bar_width() - gap * 2, bar_h), 2, 2)
+
+    def _painter(self, pixmap):
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setBrush(QBrush(self.bar_color))
         painter.setPen(Qt.PenStyle.NoPen)
+        return painter
+
+    def _scroll_in(self, amp):
+        bw = self._bar_width()
+        ratio = self._cache.devicePixelRatio()
+        self._cache.scroll(-round(bw * ratio), 0, self._cache.rect())
+        x = self.width() - bw
+        painter = self._painter(self._cache)
+        # Der älteste Balken wandert in den freien Rand links - dort bleibt wie in _render_live nichts stehen
+        painter.fillRect(QRectF(0, 0, self.width() - bw * self.bars, self.height()), self.bg_color)
+        painter.fillRect(QRectF(x, 0, bw, self.height()), self.bg_color)
+        self._draw_bar(painter, x, amp)
+        painter.end()
+
+    def _render_live(self):
+        pixmap = self._new_pixmap()
+        bw = self._bar_width()
+        offset = self.width() - bw * self.bars
+        painter = self._painter(pixmap)
+        # Ring ab dem ältesten Eintrag lesen
+        levels = [0.0] * self.bars if self._ring is None else self.np.roll(self._ring, -self._head)
+        for i, amp in enumerate(levels):
+            self._draw_bar(painter, offset + i * bw, amp)
+        painter.end()
+        return pixmap
 
-        for i, amp in enumerate(self.amplitudes):
-            bar_h = max(2, amp * (h * 0.8))
-            x = i * bar_width
-            y = (h - bar_h) / 2
-            
-            gap = 1
-            painter.drawRoundedRect(QRectF(x + gap, y, bar_width - gap*2, bar_h), 2, 2)
+    def _render_overview(self):
+        pixmap = self._new_pixmap()
+        w, h = self.width(), self.height()
+        columns = min(self._count, max(1, w // 2))
+        if columns == 0: return pixmap
+        # Maximum pro Spalte über die ganze Aufnahme - eine vektorisierte Reduktion
+        edges = self.np.linspace(0, self._count, columns + 1).astype(int)[:-1]
+        peaks = self.np.maximum.reduceat(self._history[:self._count], edges)
+        step = w / columns
+        painter = self._painter(pixmap)
+        for i, amp in enumerate(peaks):
+            bar_h = max(1.0, amp * (h * 0.8))
+            painter.drawRect(QRectF(i * step, (h - bar_h) / 2, max(1.0, step - 0.5), bar_h))
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._cache is None or self._cache.deviceIndependentSize().toSize() != self.size():
+            self._cache = self._render_overview() if self.overview else self._render_live()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
 
 class RecordingOverlay(QWidget):
     """Kombiniert Visualizer und Timer"""
-    def __init__(self):
+    def __init__(self, bars=50):
         super().__init__()
         layout = QVBoxLayout()
         layout.setContentsMargins(0,0,0,0)
@@ -58,7 +144,7 @@ class RecordingOverlay(QWidget):
         self.lbl_timer.setStyleSheet("font-size: 16px; font-weight: bold; color: #333;")
         layout.addWidget(self.lbl_timer)
         
-        self.viz = AudioVisualizer()
+        self.viz = AudioVisualizer(bars)
         layout.addWidget(self.viz)
         
         self.setLayout(layout)
@@ -70,6 +156,7 @@ class RecordingOverlay(QWidget):
     def start(self):
         self.seconds = 0
         self.lbl_timer.setText("00:00")
+        self.viz.overview = False
         self.viz.clear() # Sicherstellen dass wir sauber starten
         self.timer.start(1000)
 